@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -49,7 +49,13 @@ class AccessoryTable(TypedDict):
 class Accessories:
     """Accessory XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/accessory_ids.csv",
+        "{iXAssets}/mp/accessorytable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/accessories.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Accessory XAssets."""
 
         accessories: List[Dict[str, Any]] = []
@@ -61,6 +67,8 @@ class Accessories:
 
         log.info(f"Compiled {len(accessories):,} Accessories")
 
+        return accessories
+
     def IDs(self: Any, accessories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/accessory_ids.csv XAsset."""
 
@@ -71,7 +79,17 @@ class Accessories:
         if ids is None:
             return accessories
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             accessories.append(
                 {
                     "id": entry.get("id"),
@@ -81,9 +99,9 @@ class Accessories:
                     "flavor": self.localize.get(
                         "STORE_FLAVOR/" + entry.get("ref").upper() + "_FLAVOR"
                     ),
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "hidden": None,
                     "image": None,
                 }
@@ -101,14 +119,10 @@ class Accessories:
         if table is None:
             return accessories
 
-        for accessory in accessories:
-            for entry in table:
-                if accessory.get("altId") != entry.get("ref"):
-                    continue
-
-                accessory["name"] = self.localize.get(entry.get("name"))
-                accessory["description"] = self.localize.get(entry.get("description"))
-                accessory["image"] = entry.get("lootImage")
-                accessory["hidden"] = bool(entry.get("hideInUI"))
+        for accessory, entry in Utility.Join(self, accessories, table, "altId", "ref"):
+            accessory["name"] = self.localize.get(entry.get("name"))
+            accessory["description"] = self.localize.get(entry.get("description"))
+            accessory["image"] = entry.get("lootImage")
+            accessory["hidden"] = bool(entry.get("hideInUI"))
 
         return accessories
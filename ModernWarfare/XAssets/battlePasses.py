@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -53,7 +53,10 @@ class BattlePassIDs(TypedDict):
 class BattlePasses:
     """Battle Pass XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/loot/battlepass_season*.csv"]
+    outputs: List[str] = ["{eXAssets}/battlePasses.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Battle Pass XAssets."""
 
         battlePasses: List[Dict[str, Any]] = []
@@ -64,6 +67,8 @@ class BattlePasses:
 
         log.info(f"Compiled {len(battlePasses):,} Battle Passes")
 
+        return battlePasses
+
     def Table(self: Any, battlePasses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/battlepass_season*.csv XAssets."""
 
@@ -89,7 +94,7 @@ class BattlePasses:
                     battlePasses[-1]["items"].append(
                         {
                             "id": item,
-                            "type": self.ModernWarfare.GetLootType(item),
+                            "type": None,
                             "tier": entry.get("level"),
                             "free": bool(entry.get("isFree")),
                             "codPoints": None
@@ -99,13 +104,24 @@ class BattlePasses:
                         }
                     )
 
+            rewards: List[Dict[str, Any]] = battlePasses[-1]["items"]
+            types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+                [reward.get("id") for reward in rewards]
+            )
+
+            for reward, lootType in zip(rewards, types):
+                reward["type"] = lootType
+
         return battlePasses
 
 
 class BattlePassItems:
     """Battle Pass Item XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/loot/battlepass_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/battlePassItems.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Battle Pass Item XAssets."""
 
         items: List[Dict[str, Any]] = []
@@ -116,6 +132,8 @@ class BattlePassItems:
 
         log.info(f"Compiled {len(items):,} Battle Pass Items")
 
+        return items
+
     def Table(self: Any, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/battlepass_ids.csv XAsset."""
 
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -64,7 +64,10 @@ class BundleIDs(TypedDict):
 class Bundles:
     """Bundle XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/loot/bundle_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/bundles.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Bundle XAssets."""
 
         bundles: List[Dict[str, Any]] = []
@@ -75,6 +78,8 @@ class Bundles:
 
         log.info(f"Compiled {len(bundles):,} Bundles")
 
+        return bundles
+
     def IDs(self: Any, bundles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/bundle_ids.csv XAsset."""
 
@@ -85,7 +90,12 @@ class Bundles:
         if ids is None:
             return bundles
 
-        for entry in ids:
+        items: List[Dict[str, Any]] = []
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, season in zip(ids, seasons):
             if bool(entry.get("isCollection")) is False:
                 bundles.append(
                     {
@@ -96,9 +106,7 @@ class Bundles:
                         "flavor": self.localize.get(entry.get("flavorText")),
                         "feature": self.localize.get(entry.get("featureText")),
                         "type": self.localize.get(entry.get("bundleType")),
-                        "season": self.ModernWarfare.GetLootSeason(
-                            entry.get("license")
-                        ),
+                        "season": season,
                         "billboard": None
                         if (i := entry.get("image")) == "placeholder_x"
                         else i,
@@ -117,16 +125,21 @@ class Bundles:
                 if (item := entry.get(f"item{i}")) is None:
                     continue
 
-                bundles[-1]["items"].append(
-                    {"id": item, "type": self.ModernWarfare.GetLootType(item),}
-                )
+                items.append({"id": item, "type": None})
+                bundles[-1]["items"].append(items[-1])
 
             for i in range(1, entry.get("numHiddenItems") + 1):
                 if (item := entry.get(f"hiddenItem{i}")) is None:
                     continue
 
-                bundles[-1]["hiddenItems"].append(
-                    {"id": item, "type": self.ModernWarfare.GetLootType(item),}
-                )
+                items.append({"id": item, "type": None})
+                bundles[-1]["hiddenItems"].append(items[-1])
+
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [item.get("id") for item in items]
+        )
+
+        for item, lootType in zip(items, types):
+            item["type"] = lootType
 
         return bundles
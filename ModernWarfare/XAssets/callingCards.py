@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -37,7 +37,13 @@ class CallingCardsTable(TypedDict):
 class CallingCards:
     """Calling Card XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/playercards_ids.csv",
+        "{iXAssets}/mp/callingcards.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/callingCards.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Calling Card XAssets."""
 
         cards: List[Dict[str, Any]] = []
@@ -49,6 +55,8 @@ class CallingCards:
 
         log.info(f"Compiled {len(cards):,} Calling Cards")
 
+        return cards
+
     def IDs(self: Any, cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/playercards_ids.csv XAsset."""
 
@@ -59,15 +67,25 @@ class CallingCards:
         if ids is None:
             return cards
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             cards.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "hidden": None,
                     "image": None,
                 }
@@ -85,13 +103,9 @@ class CallingCards:
         if table is None:
             return cards
 
-        for card in cards:
-            for entry in table:
-                if card.get("altId") != entry.get("ref"):
-                    continue
-
-                card["name"] = self.localize.get(entry.get("name"))
-                card["hidden"] = bool(entry.get("hideInUI"))
-                card["image"] = entry.get("image")
+        for card, entry in Utility.Join(self, cards, table, "altId", "ref"):
+            card["name"] = self.localize.get(entry.get("name"))
+            card["hidden"] = bool(entry.get("hideInUI"))
+            card["image"] = entry.get("image")
 
         return cards
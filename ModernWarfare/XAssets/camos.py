@@ -1,6 +1,7 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
+from table import Table
 from utility import Utility
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -36,7 +37,14 @@ class CamoTable(TypedDict):
 class Camos:
     """Camo XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/camo_ids.csv",
+        "{iXAssets}/mp/camotable.csv",
+        "{iXAssets}/mp/camocategorytable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/camos.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Camo XAssets."""
 
         camos: List[Dict[str, Any]] = []
@@ -48,26 +56,36 @@ class Camos:
 
         log.info(f"Compiled {len(camos):,} Camos")
 
+        return camos
+
     def IDs(self: Any, camos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/camo_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
+        ids: Table = Utility.ReadTable(
             self, f"{self.iXAssets}/loot/camo_ids.csv", CamoIDs
         )
 
         if ids is None:
             return camos
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(ids.Column("id"))
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            ids.Column("rarity")
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            ids.Column("license")
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             camos.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
                     "category": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "hidden": None,
                     "image": None,
                 }
@@ -85,16 +103,10 @@ class Camos:
         if table is None:
             return camos
 
-        for camo in camos:
-            for entry in table:
-                if camo.get("altId") != entry.get("ref"):
-                    continue
-
-                camo["name"] = self.localize.get(entry.get("name"))
-                camo["category"] = self.ModernWarfare.GetCamoCategory(
-                    entry.get("category")
-                )
-                camo["hidden"] = bool(entry.get("hidden"))
-                camo["image"] = entry.get("image")
+        for camo, entry in Utility.Join(self, camos, table, "altId", "ref"):
+            camo["name"] = self.localize.get(entry.get("name"))
+            camo["category"] = self.ModernWarfare.GetCamoCategory(entry.get("category"))
+            camo["hidden"] = bool(entry.get("hidden"))
+            camo["image"] = entry.get("image")
 
         return camos
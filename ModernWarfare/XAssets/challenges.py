@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional, TypedDict, Union
+from typing import Any, Dict, Iterator, List, Optional, TypedDict, Union
 
 from utility import Utility
 
@@ -111,7 +111,10 @@ class MiscChallenges(TypedDict):
 class OfficerChallenges:
     """Officer Challenge XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/elder_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/officerChallenges.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Officer Challenge XAssets."""
 
         challenges: List[Dict[str, Any]] = []
@@ -122,16 +125,15 @@ class OfficerChallenges:
 
         log.info(f"Compiled {len(challenges):,} Officer Challenges")
 
+        return challenges
+
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the elder_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/elder_challenges.csv", ElderChallenges
         )
 
-        if table is None:
-            return challenges
-
         for entry in table:
             if (ref := entry.get("ref")).startswith("ch_elder_s"):
                 season: Optional[int] = int(ref.split("ch_elder_s")[1].split("_")[0])
@@ -159,7 +161,10 @@ class OfficerChallenges:
 class WeaponUnlockChallenges:
     """Weapon Unlock Challenge XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/gun_unlock_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/weaponUnlockChallenges.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Weapon Unlock Challenge XAssets."""
 
         challenges: List[Dict[str, Any]] = []
@@ -172,16 +177,15 @@ class WeaponUnlockChallenges:
 
         log.info(f"Compiled {len(challenges):,} Weapon Unlock Challenges")
 
+        return challenges
+
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the gun_unlock_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/gun_unlock_challenges.csv", GunUnlockChallenges
         )
 
-        if table is None:
-            return challenges
-
         for entry in table:
             if (amount := entry.get("amount")) is not None:
                 amount: Optional[Union[str, int]] = f"{amount:,}"
@@ -204,7 +208,10 @@ class WeaponUnlockChallenges:
 class WeeklyChallengesBR:
     """Weekly Battle Royale Challenges XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/br_weekly_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/weeklyChallengesBR.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Weekly Battle Royale Challenges XAssets."""
 
         challenges: List[Dict[str, Any]] = []
@@ -215,16 +222,15 @@ class WeeklyChallengesBR:
 
         log.info(f"Compiled {len(challenges):,} Weekly Battle Royale Challenges")
 
+        return challenges
+
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the br_weekly_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/br_weekly_challenges.csv", BRWeeklyChallenges
         )
 
-        if table is None:
-            return challenges
-
         for entry in table:
             altId: str = entry.get("ref")
 
@@ -261,7 +267,10 @@ class WeeklyChallengesBR:
 class WeeklyChallengesMP:
     """Weekly Multiplayer Challenges XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/weekly_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/weeklyChallengesMP.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Weekly Multiplayer Challenges XAssets."""
 
         challenges: List[Dict[str, Any]] = []
@@ -272,16 +281,15 @@ class WeeklyChallengesMP:
 
         log.info(f"Compiled {len(challenges):,} Weekly Multiplayer Challenges")
 
+        return challenges
+
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the weekly_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/weekly_challenges.csv", WeeklyChallenges
         )
 
-        if table is None:
-            return challenges
-
         for entry in table:
             altId: str = entry.get("ref")
 
@@ -318,7 +326,10 @@ class WeeklyChallengesMP:
 class MasteryChallenges:
     """Mastery Challenges XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/sticker_book_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/masteryChallenges.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Mastery Challenges XAssets."""
 
         challenges: List[Dict[str, Any]] = []
@@ -329,16 +340,15 @@ class MasteryChallenges:
 
         log.info(f"Compiled {len(challenges):,} Mastery Challenges")
 
+        return challenges
+
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the sticker_book_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/sticker_book_challenges.csv", StickerBookChallenges
         )
 
-        if table is None:
-            return challenges
-
         for entry in table:
             challenges.append(
                 {
@@ -373,7 +383,10 @@ class MasteryChallenges:
 class TurboChallenges:
     """Tomogunchi Turbo Challenges XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/mp/petwatchturbotable.csv"]
+    outputs: List[str] = ["{eXAssets}/turboChallenges.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Tomogunchi Turbo Challenges XAssets."""
 
         challenges: List[Dict[str, Any]] = []
@@ -384,16 +397,15 @@ class TurboChallenges:
 
         log.info(f"Compiled {len(challenges):,} Tomogunchi Turbo Challenges")
 
+        return challenges
+
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/petwatchturbotable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/mp/petwatchturbotable.csv", PetWatchTurboTable
         )
 
-        if table is None:
-            return challenges
-
         for entry in table:
             challenges.append(
                 {
@@ -414,7 +426,10 @@ class TurboChallenges:
 class MiscellaneousChallenges:
     """Miscellaneous Challenges XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/misc_challenges.csv"]
+    outputs: List[str] = ["{eXAssets}/miscChallenges.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Miscellaneous Challenges XAssets."""
 
         challenges: List[Dict[str, Any]] = []
@@ -425,16 +440,15 @@ class MiscellaneousChallenges:
 
         log.info(f"Compiled {len(challenges):,} Miscellaneous Challenges")
 
+        return challenges
+
     def Table(self: Any, challenges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the misc_challenges.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/misc_challenges.csv", MiscChallenges
         )
 
-        if table is None:
-            return challenges
-
         for entry in table:
             if (d := self.localize.get(entry.get("desc"))) is not None:
                 desc: Optional[str] = d
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -35,7 +35,13 @@ class WeaponCharmTable(TypedDict):
 class Charms:
     """Charm XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/weapon_charm_ids.csv",
+        "{iXAssets}/mp/weaponcharmtable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/charms.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Charm XAssets."""
 
         charms: List[Dict[str, Any]] = []
@@ -47,6 +53,8 @@ class Charms:
 
         log.info(f"Compiled {len(charms):,} Charms")
 
+        return charms
+
     def IDs(self: Any, charms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/weapon_charm_ids.csv XAsset."""
 
@@ -57,7 +65,17 @@ class Charms:
         if ids is None:
             return charms
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             charms.append(
                 {
                     "id": entry.get("id"),
@@ -66,9 +84,9 @@ class Charms:
                     "flavor": self.localize.get(
                         "STORE_FLAVOR/" + entry.get("ref").upper() + "_FLAVOR"
                     ),
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "hidden": None,
                     "image": None,
                     "background": "ui_loot_bg_charm",
@@ -87,13 +105,9 @@ class Charms:
         if table is None:
             return charms
 
-        for charm in charms:
-            for entry in table:
-                if charm.get("altId") != entry.get("ref"):
-                    continue
-
-                charm["name"] = self.localize.get(entry.get("name"))
-                charm["hidden"] = bool(entry.get("hideInUI"))
-                charm["image"] = entry.get("image")
+        for charm, entry in Utility.Join(self, charms, table, "altId", "ref"):
+            charm["name"] = self.localize.get(entry.get("name"))
+            charm["hidden"] = bool(entry.get("hideInUI"))
+            charm["image"] = entry.get("image")
 
         return charms
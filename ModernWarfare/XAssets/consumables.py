@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -26,7 +26,10 @@ class ConsumableIDs(TypedDict):
 class Consumables:
     """Consumable XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/loot/consumable_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/consumables.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Consumable XAssets."""
 
         consumables: List[Dict[str, Any]] = []
@@ -37,6 +40,8 @@ class Consumables:
 
         log.info(f"Compiled {len(consumables):,} Consumables")
 
+        return consumables
+
     def IDs(self: Any, consumables: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/consumable_ids.csv XAsset."""
 
@@ -47,15 +52,22 @@ class Consumables:
         if ids is None:
             return consumables
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("quality") for entry in ids]
+        )
+
+        for entry, lootType, rarity in zip(ids, types, rarities):
             consumables.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": self.localize.get(entry.get("name")),
                     "description": self.localize.get(entry.get("duration")),
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("quality")),
+                    "type": lootType,
+                    "rarity": rarity,
                     "image": None
                     if ((i := entry.get("image")) == "placeholder_x") or (i == "white")
                     else i,
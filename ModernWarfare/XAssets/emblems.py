@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -38,7 +38,13 @@ class EmblemTable(TypedDict):
 class Emblems:
     """Emblem XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/emblems_ids.csv",
+        "{iXAssets}/mp/emblemtable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/emblems.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Emblem XAssets."""
 
         emblems: List[Dict[str, Any]] = []
@@ -50,6 +56,8 @@ class Emblems:
 
         log.info(f"Compiled {len(emblems):,} Emblems")
 
+        return emblems
+
     def IDs(self: Any, emblems: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/emblems_ids.csv XAsset."""
 
@@ -60,15 +68,25 @@ class Emblems:
         if ids is None:
             return emblems
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             emblems.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "hidden": None,
                     "image": None,
                     "background": "ui_loot_bg_emblem",
@@ -87,13 +105,9 @@ class Emblems:
         if table is None:
             return emblems
 
-        for emblem in emblems:
-            for entry in table:
-                if emblem.get("altId") != entry.get("ref"):
-                    continue
-
-                emblem["name"] = self.localize.get(entry.get("name"))
-                emblem["hidden"] = bool(entry.get("hideInUI"))
-                emblem["image"] = entry.get("image")
+        for emblem, entry in Utility.Join(self, emblems, table, "altId", "ref"):
+            emblem["name"] = self.localize.get(entry.get("name"))
+            emblem["hidden"] = bool(entry.get("hideInUI"))
+            emblem["image"] = entry.get("image")
 
         return emblems
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -47,7 +47,13 @@ class EquipmentTable(TypedDict):
 class Equipment:
     """Equipment XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/equipment_ids.csv",
+        "{iXAssets}/mp/equipment.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/equipment.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Equipment XAssets."""
 
         equipment: List[Dict[str, Any]] = []
@@ -59,6 +65,8 @@ class Equipment:
 
         log.info(f"Compiled {len(equipment):,} Equipment")
 
+        return equipment
+
     def IDs(self: Any, equipment: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/equipment_ids.csv XAsset."""
 
@@ -69,15 +77,22 @@ class Equipment:
         if ids is None:
             return equipment
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+
+        for entry, lootType, rarity in zip(ids, types, rarities):
             equipment.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
                     "description": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
+                    "type": lootType,
+                    "rarity": rarity,
                     "image": None,
                     "icon": None,
                     "video": None,
@@ -96,15 +111,11 @@ class Equipment:
         if table is None:
             return equipment
 
-        for item in equipment:
-            for entry in table:
-                if item.get("altId") != entry.get("ref"):
-                    continue
-
-                item["name"] = self.localize.get(entry.get("nameRef"))
-                item["description"] = self.localize.get(entry.get("desc"))
-                item["image"] = entry.get("progressionImage")
-                item["icon"] = entry.get("image")
-                item["video"] = entry.get("tutorialVideo")
+        for item, entry in Utility.Join(self, equipment, table, "altId", "ref"):
+            item["name"] = self.localize.get(entry.get("nameRef"))
+            item["description"] = self.localize.get(entry.get("desc"))
+            item["image"] = entry.get("progressionImage")
+            item["icon"] = entry.get("image")
+            item["video"] = entry.get("tutorialVideo")
 
         return equipment
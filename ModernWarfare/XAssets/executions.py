@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -45,7 +45,14 @@ class ExecutionTable(TypedDict):
 class Executions:
     """Execution XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/executions_ids.csv",
+        "{iXAssets}/mp_cp/executiontable.csv",
+        "{iXAssets}/loot/operator_ids.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/executions.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Execution XAssets."""
 
         executions: List[Dict[str, Any]] = []
@@ -57,6 +64,8 @@ class Executions:
 
         log.info(f"Compiled {len(executions):,} Executions")
 
+        return executions
+
     def IDs(self: Any, executions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/executions_ids.csv XAsset."""
 
@@ -67,15 +76,25 @@ class Executions:
         if ids is None:
             return executions
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             executions.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "operatorId": None,
                     "operatorAltId": None,
                     "pet": None,
@@ -97,18 +116,14 @@ class Executions:
         if table is None:
             return executions
 
-        for execution in executions:
-            for entry in table:
-                if execution.get("altId") != entry.get("ref"):
-                    continue
-
-                execution["name"] = self.localize.get(entry.get("name"))
-                execution["operatorId"] = self.ModernWarfare.GetOperatorID(
-                    entry.get("operatorRef")
-                )
-                execution["operatorAltId"] = entry.get("operatorRef")
-                execution["pet"] = entry.get("pet")
-                execution["image"] = entry.get("lootImage")
-                execution["video"] = entry.get("videoPreview")
+        for execution, entry in Utility.Join(self, executions, table, "altId", "ref"):
+            execution["name"] = self.localize.get(entry.get("name"))
+            execution["operatorId"] = self.ModernWarfare.GetOperatorID(
+                entry.get("operatorRef")
+            )
+            execution["operatorAltId"] = entry.get("operatorRef")
+            execution["pet"] = entry.get("pet")
+            execution["image"] = entry.get("lootImage")
+            execution["video"] = entry.get("videoPreview")
 
         return executions
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -25,7 +25,10 @@ class FeatureIDs(TypedDict):
 class Features:
     """Feature XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/loot/feature_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/features.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Feature XAssets."""
 
         features: List[Dict[str, Any]] = []
@@ -36,6 +39,8 @@ class Features:
 
         log.info(f"Compiled {len(features):,} Features")
 
+        return features
+
     def IDs(self: Any, features: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/feature_ids.csv XAsset."""
 
@@ -46,7 +51,14 @@ class Features:
         if ids is None:
             return features
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("index") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("quality") for entry in ids]
+        )
+
+        for entry, lootType, rarity in zip(ids, types, rarities):
             features.append(
                 {
                     "id": entry.get("index"),
@@ -55,8 +67,8 @@ class Features:
                     if (n := self.localize.get(entry.get("name"))) is None
                     else n.replace("&&1 ", ""),
                     "description": self.localize.get(entry.get("desc")),
-                    "type": self.ModernWarfare.GetLootType(entry.get("index")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("quality")),
+                    "type": lootType,
+                    "rarity": rarity,
                     "image": None if (i := entry.get("hudImage")) == "white" else i,
                     "background": "ui_loot_bg_generic",
                 }
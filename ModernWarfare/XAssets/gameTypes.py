@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, Iterator, List, TypedDict
 
 from utility import Utility
 
@@ -45,7 +45,10 @@ class GameTypesTable(TypedDict):
 class GameTypes:
     """Game Type XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/mp/gametypestable.csv"]
+    outputs: List[str] = ["{eXAssets}/gameTypes.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Game Type XAssets."""
 
         types: List[Dict[str, Any]] = []
@@ -56,16 +59,15 @@ class GameTypes:
 
         log.info(f"Compiled {len(types):,} Game Types")
 
+        return types
+
     def Table(self: Any, types: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/gametypestable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/mp/gametypestable.csv", GameTypesTable
         )
 
-        if table is None:
-            return types
-
         for entry in table:
             types.append(
                 {
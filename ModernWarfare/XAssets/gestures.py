@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -40,7 +40,13 @@ class GestureTable(TypedDict):
 class Gestures:
     """Gesture XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/gestures_ids.csv",
+        "{iXAssets}/mp/gesturetable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/gestures.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Gesture XAssets."""
 
         gestures: List[Dict[str, Any]] = []
@@ -52,6 +58,8 @@ class Gestures:
 
         log.info(f"Compiled {len(gestures):,} Gestures")
 
+        return gestures
+
     def IDs(self: Any, gestures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/gestures_ids.csv XAsset."""
 
@@ -62,15 +70,25 @@ class Gestures:
         if ids is None:
             return gestures
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             gestures.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "hidden": None,
                     "image": None,
                     "background": "ui_loot_bg_gesture",
@@ -89,13 +107,9 @@ class Gestures:
         if table is None:
             return gestures
 
-        for gesture in gestures:
-            for entry in table:
-                if gesture.get("altId") != entry.get("ref"):
-                    continue
-
-                gesture["name"] = self.localize.get(entry.get("name"))
-                gesture["hidden"] = bool(entry.get("hideInUI"))
-                gesture["image"] = entry.get("lootImage")
+        for gesture, entry in Utility.Join(self, gestures, table, "altId", "ref"):
+            gesture["name"] = self.localize.get(entry.get("name"))
+            gesture["hidden"] = bool(entry.get("hideInUI"))
+            gesture["image"] = entry.get("lootImage")
 
         return gestures
@@ -22,7 +22,10 @@ class ItemSourceTable(TypedDict):
 class ItemSources:
     """Item Source XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/mp/itemsourcetable.csv"]
+    outputs: List[str] = ["{eXAssets}/itemSources.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Item Source XAssets."""
 
         sources: List[Dict[str, Any]] = []
@@ -33,6 +36,8 @@ class ItemSources:
 
         log.info(f"Compiled {len(sources):,} Item Sources")
 
+        return sources
+
     def Table(self: Any, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/itemsourcetable.csv XAsset."""
 
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -53,7 +53,13 @@ class KillstreakTable(TypedDict):
 class Killstreaks:
     """Killstreak XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/killstreak_ids.csv",
+        "{iXAssets}/mp/killstreaktable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/killstreaks.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Killstreak XAssets."""
 
         streaks: List[Dict[str, Any]] = []
@@ -65,6 +71,8 @@ class Killstreaks:
 
         log.info(f"Compiled {len(streaks):,} Killstreaks")
 
+        return streaks
+
     def IDs(self: Any, streaks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/killstreak_ids.csv XAsset."""
 
@@ -75,15 +83,22 @@ class Killstreaks:
         if ids is None:
             return streaks
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+
+        for entry, lootType, rarity in zip(ids, types, rarities):
             streaks.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
                     "description": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
+                    "type": lootType,
+                    "rarity": rarity,
                     "category": None,
                     "costKills": None,
                     "costScore": None,
@@ -106,25 +121,21 @@ class Killstreaks:
         if table is None:
             return streaks
 
-        for streak in streaks:
-            for entry in table:
-                if streak.get("altId") != entry.get("ref"):
-                    continue
-
-                streak["name"] = self.localize.get(entry.get("name"))
-                streak["description"] = self.localize.get(entry.get("desc"))
-                streak["category"] = (
-                    None if (c := entry.get("streakType")) is None else c.title()
-                )
-                streak["costKills"] = entry.get("kills")
-                streak["costScore"] = entry.get("scoreCost")
-                streak["hidden"] = not bool(entry.get("showInMenus"))
-                streak["image"] = (
-                    None
-                    if (img := entry.get("progressionImage")) == "placeholder_x"
-                    else img
-                )
-                streak["icon"] = entry.get("tabletImage")
-                streak["video"] = entry.get("tutorialVideo")
+        for streak, entry in Utility.Join(self, streaks, table, "altId", "ref"):
+            streak["name"] = self.localize.get(entry.get("name"))
+            streak["description"] = self.localize.get(entry.get("desc"))
+            streak["category"] = (
+                None if (c := entry.get("streakType")) is None else c.title()
+            )
+            streak["costKills"] = entry.get("kills")
+            streak["costScore"] = entry.get("scoreCost")
+            streak["hidden"] = not bool(entry.get("showInMenus"))
+            streak["image"] = (
+                None
+                if (img := entry.get("progressionImage")) == "placeholder_x"
+                else img
+            )
+            streak["icon"] = entry.get("tabletImage")
+            streak["video"] = entry.get("tutorialVideo")
 
         return streaks
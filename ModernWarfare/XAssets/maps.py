@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, Iterator, List, TypedDict
 
 from utility import Utility
 
@@ -61,7 +61,10 @@ class MapInfo(TypedDict):
 class Maps:
     """Map XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/mp/mapinfo.csv"]
+    outputs: List[str] = ["{eXAssets}/maps.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Map XAssets."""
 
         maps: List[Dict[str, Any]] = []
@@ -72,16 +75,15 @@ class Maps:
 
         log.info(f"Compiled {len(maps):,} Maps")
 
+        return maps
+
     def Table(self: Any, maps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/mapinfo.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/mp/mapinfo.csv", MapInfo
         )
 
-        if table is None:
-            return maps
-
         for entry in table:
             maps.append(
                 {
@@ -68,7 +68,13 @@ class MissionIDs(TypedDict):
 class Missions:
     """Mission XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/quest_challenges.csv",
+        "{iXAssets}/mp/intel_challenges.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/missions.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Mission XAssets."""
 
         missions: List[Dict[str, Any]] = []
@@ -80,6 +86,8 @@ class Missions:
 
         log.info(f"Compiled {len(missions):,} Missions")
 
+        return missions
+
     def QuestTable(self: Any, missions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the quest_challenges.csv XAsset."""
 
@@ -150,13 +158,14 @@ class Missions:
         if table is None:
             return missions
 
-        for mission in missions:
-            for objective in mission.get("objectives", []):
-                for entry in table:
-                    if objective.get("altId") != entry.get("ref"):
-                        continue
+        objectives: List[Dict[str, Any]] = [
+            objective
+            for mission in missions
+            for objective in mission.get("objectives", [])
+        ]
 
-                    objective["image"] = entry.get("image")
+        for objective, entry in Utility.Join(self, objectives, table, "altId", "ref"):
+            objective["image"] = entry.get("image")
 
         return missions
 
@@ -164,7 +173,10 @@ class Missions:
 class MissionItems:
     """Mission Item XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/loot/mission_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/missionItems.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Mission Item XAssets."""
 
         items: List[Dict[str, Any]] = []
@@ -175,6 +187,8 @@ class MissionItems:
 
         log.info(f"Compiled {len(items):,} Mission Items")
 
+        return items
+
     def IDs(self: Any, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/mission_ids.csv XAsset."""
 
@@ -185,25 +199,33 @@ class MissionItems:
         if ids is None:
             return items
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("index") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("quality") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+        rewards: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("operatorSkinID") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season, reward in zip(
+            ids, types, rarities, seasons, rewards
+        ):
             items.append(
                 {
                     "id": entry.get("index"),
                     "altId": entry.get("ref"),
                     "name": self.localize.get(entry.get("missionName")),
-                    "type": self.ModernWarfare.GetLootType(entry.get("index")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("quality")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "image": entry.get("missionImage"),
                     "background": "ui_loot_bg_feature",
-                    "rewards": [
-                        {
-                            "id": entry.get("operatorSkinID"),
-                            "type": self.ModernWarfare.GetLootType(
-                                entry.get("operatorSkinID")
-                            ),
-                        }
-                    ],
+                    "rewards": [{"id": entry.get("operatorSkinID"), "type": reward}],
                 }
             )
 
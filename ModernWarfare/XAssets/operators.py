@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -106,7 +106,15 @@ class IntelBillets(TypedDict):
 class Operators:
     """Operator XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/operator_ids.csv",
+        "{iXAssets}/operators.csv",
+        "{iXAssets}/mp/factiontable.csv",
+        "{iXAssets}/cp/cp_intel_billets.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/operators.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Operator XAssets."""
 
         operators: List[Dict[str, Any]] = []
@@ -120,6 +128,8 @@ class Operators:
 
         log.info(f"Compiled {len(operators):,} Operators")
 
+        return operators
+
     def IDs(self: Any, operators: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/operators_ids.csv XAsset."""
 
@@ -128,18 +138,26 @@ class Operators:
         if ids is None:
             return operators
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") * 1000 for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             operators.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
                     "description": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(
-                        entry.get("license") * 1000
-                    ),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "faction": None,
                     "branch": None,
                     "branchIcon": None,
@@ -164,40 +182,36 @@ class Operators:
         if table is None:
             return operators
 
-        for operator in operators:
-            for entry in table:
-                if operator.get("altId") != entry.get("ref"):
-                    continue
-
-                operator["name"] = self.localize.get(entry.get("name")).title()
-                operator["description"] = self.localize.get(entry.get("background"))
-                operator["faction"] = entry.get("superFaction")
-                operator["branch"] = entry.get("factionRef")
-                operator["branchIcon"] = entry.get("factionIcon")
-                operator["thumbprint"] = entry.get("thumbprint")
-                operator["launchOperator"] = bool(entry.get("isLaunchOperator"))
-                operator["image"] = entry.get("icon")
-                operator["video"] = (
-                    None
-                    if ((v := entry.get("introVideo")) is None)
-                    or (v.endswith("_placeholder"))
-                    else v
-                )
-                operator["hidden"] = bool(entry.get("hiddenWhenLocked"))
-                operator["billets"] = [
-                    {
-                        "label": self.localize.get("LUA_MENU/CITIZENSHIP"),
-                        "value": self.localize.get(entry.get("citizenship")),
-                    },
-                    {
-                        "label": self.localize.get("LUA_MENU/FIRST_LANGUAGE"),
-                        "value": self.localize.get(entry.get("firstLanguage")),
-                    },
-                    {
-                        "label": self.localize.get("LUA_MENU/STATUS"),
-                        "value": self.localize.get(entry.get("status")),
-                    },
-                ]
+        for operator, entry in Utility.Join(self, operators, table, "altId", "ref"):
+            operator["name"] = self.localize.get(entry.get("name")).title()
+            operator["description"] = self.localize.get(entry.get("background"))
+            operator["faction"] = entry.get("superFaction")
+            operator["branch"] = entry.get("factionRef")
+            operator["branchIcon"] = entry.get("factionIcon")
+            operator["thumbprint"] = entry.get("thumbprint")
+            operator["launchOperator"] = bool(entry.get("isLaunchOperator"))
+            operator["image"] = entry.get("icon")
+            operator["video"] = (
+                None
+                if ((v := entry.get("introVideo")) is None)
+                or (v.endswith("_placeholder"))
+                else v
+            )
+            operator["hidden"] = bool(entry.get("hiddenWhenLocked"))
+            operator["billets"] = [
+                {
+                    "label": self.localize.get("LUA_MENU/CITIZENSHIP"),
+                    "value": self.localize.get(entry.get("citizenship")),
+                },
+                {
+                    "label": self.localize.get("LUA_MENU/FIRST_LANGUAGE"),
+                    "value": self.localize.get(entry.get("firstLanguage")),
+                },
+                {
+                    "label": self.localize.get("LUA_MENU/STATUS"),
+                    "value": self.localize.get(entry.get("status")),
+                },
+            ]
 
         return operators
 
@@ -213,25 +227,21 @@ class Operators:
         if table is None:
             return operators
 
-        for operator in operators:
-            for entry in table:
-                if operator.get("branch") != entry.get("ref"):
-                    continue
-
-                operator["branch"] = self.localize.get(entry.get("name"))
-
-                if operator.get("altId").startswith("default_"):
-                    # This is a (temporary?) workaround as Infinity Ward does
-                    # not distinguish the two Mil-Sim branches in the factiontable,
-                    # thus resulting in each incorrectly belonging to Coalition.
-                    if (faction := operator.get("faction")) == 0:
-                        operator["faction"] = self.localize.get("LUA_MENU/THE_WEST")
-                    elif faction == 1:
-                        operator["faction"] = self.localize.get("LUA_MENU/THE_EAST")
-                    else:
-                        operator["faction"] = None
+        for operator, entry in Utility.Join(self, operators, table, "branch", "ref"):
+            operator["branch"] = self.localize.get(entry.get("name"))
+
+            if operator.get("altId").startswith("default_"):
+                # This is a (temporary?) workaround as Infinity Ward does
+                # not distinguish the two Mil-Sim branches in the factiontable,
+                # thus resulting in each incorrectly belonging to Coalition.
+                if (faction := operator.get("faction")) == 0:
+                    operator["faction"] = self.localize.get("LUA_MENU/THE_WEST")
+                elif faction == 1:
+                    operator["faction"] = self.localize.get("LUA_MENU/THE_EAST")
                 else:
-                    operator["faction"] = self.localize.get(entry.get("superFactionName"))
+                    operator["faction"] = None
+            else:
+                operator["faction"] = self.localize.get(entry.get("superFactionName"))
 
         return operators
 
@@ -247,123 +257,104 @@ class Operators:
         if table is None:
             return operators
 
-        for operator in operators:
-            for entry in table:
-                operatorRef: str = operator.get("altId").split("_")[0]
-                entryRef: str = entry.get("ref").split("_")[1]
-
-                if operatorRef != entryRef:
-                    continue
-
-                operator["billets"].extend(
-                    [
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_NAME_TITLE"),
-                            "value": self.localize.get(entry.get("name")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_CODENAME_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("codeName")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_ALIASES_TITLE"),
-                            "value": self.localize.get(entry.get("aliases")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_NATIONALITY_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("nationality")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_DOB_TITLE"),
-                            "value": self.localize.get(entry.get("dob")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_GENDER_TITLE"),
-                            "value": self.localize.get(entry.get("gender")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_LATERALITY_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("laterality")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_HEIGHT_TITLE"),
-                            "value": self.localize.get(entry.get("height")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_WEIGHT_TITLE"),
-                            "value": self.localize.get(entry.get("weight")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_VISION_TITLE"),
-                            "value": self.localize.get(entry.get("vision")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_BLOOD_TITLE"),
-                            "value": self.localize.get(entry.get("blood")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_EYECOLOR_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("eyeColor")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_HAIR_TITLE"),
-                            "value": self.localize.get(entry.get("hairColor")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_RELATIVES_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("relatives")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_LANGUAGES_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("languages")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_MARITALSTATUS_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("maritalStatus")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_CHILDERN_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("children")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_SPECIALIST_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("specialistFields")),
-                        },
-                        {
-                            "label": self.localize.get("CP_INTEL/BILLET_HISTORY_TITLE"),
-                            "value": self.localize.get(entry.get("history")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_ASSOCIATIONS_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("associations")),
-                        },
-                        {
-                            "label": self.localize.get(
-                                "CP_INTEL/BILLET_DIRECTIVE_TITLE"
-                            ),
-                            "value": self.localize.get(entry.get("directive")),
-                        },
-                    ]
-                )
+        for operator, entry in Utility.Join(
+            self,
+            operators,
+            table,
+            lambda operator: operator.get("altId").split("_")[0],
+            lambda entry: entry.get("ref").split("_")[1],
+        ):
+            operator["billets"].extend(
+                [
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_NAME_TITLE"),
+                        "value": self.localize.get(entry.get("name")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_CODENAME_TITLE"),
+                        "value": self.localize.get(entry.get("codeName")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_ALIASES_TITLE"),
+                        "value": self.localize.get(entry.get("aliases")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_NATIONALITY_TITLE"),
+                        "value": self.localize.get(entry.get("nationality")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_DOB_TITLE"),
+                        "value": self.localize.get(entry.get("dob")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_GENDER_TITLE"),
+                        "value": self.localize.get(entry.get("gender")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_LATERALITY_TITLE"),
+                        "value": self.localize.get(entry.get("laterality")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_HEIGHT_TITLE"),
+                        "value": self.localize.get(entry.get("height")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_WEIGHT_TITLE"),
+                        "value": self.localize.get(entry.get("weight")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_VISION_TITLE"),
+                        "value": self.localize.get(entry.get("vision")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_BLOOD_TITLE"),
+                        "value": self.localize.get(entry.get("blood")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_EYECOLOR_TITLE"),
+                        "value": self.localize.get(entry.get("eyeColor")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_HAIR_TITLE"),
+                        "value": self.localize.get(entry.get("hairColor")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_RELATIVES_TITLE"),
+                        "value": self.localize.get(entry.get("relatives")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_LANGUAGES_TITLE"),
+                        "value": self.localize.get(entry.get("languages")),
+                    },
+                    {
+                        "label": self.localize.get(
+                            "CP_INTEL/BILLET_MARITALSTATUS_TITLE"
+                        ),
+                        "value": self.localize.get(entry.get("maritalStatus")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_CHILDERN_TITLE"),
+                        "value": self.localize.get(entry.get("children")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_SPECIALIST_TITLE"),
+                        "value": self.localize.get(entry.get("specialistFields")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_HISTORY_TITLE"),
+                        "value": self.localize.get(entry.get("history")),
+                    },
+                    {
+                        "label": self.localize.get(
+                            "CP_INTEL/BILLET_ASSOCIATIONS_TITLE"
+                        ),
+                        "value": self.localize.get(entry.get("associations")),
+                    },
+                    {
+                        "label": self.localize.get("CP_INTEL/BILLET_DIRECTIVE_TITLE"),
+                        "value": self.localize.get(entry.get("directive")),
+                    },
+                ]
+            )
 
         return operators
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -37,7 +37,14 @@ class OperatorQuips(TypedDict):
 class Quips:
     """Quip XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/operator_quip_ids.csv",
+        "{iXAssets}/operatorquips.csv",
+        "{iXAssets}/loot/operator_ids.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/operatorQuips.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Quip XAssets."""
 
         quips: List[Dict[str, Any]] = []
@@ -49,6 +56,8 @@ class Quips:
 
         log.info(f"Compiled {len(quips):,} Operator Quips")
 
+        return quips
+
     def IDs(self: Any, quips: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/operator_quip_ids.csv XAsset."""
 
@@ -59,16 +68,26 @@ class Quips:
         if ids is None:
             return quips
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("quality") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             quips.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
                     "description": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("quality")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "operatorId": None,
                     "operatorAltId": None,
                     "image": None,
@@ -88,17 +107,13 @@ class Quips:
         if table is None:
             return quips
 
-        for quip in quips:
-            for entry in table:
-                if quip.get("altId") != entry.get("ref"):
-                    continue
-
-                quip["name"] = self.localize.get(entry.get("name"))
-                quip["description"] = self.localize.get(entry.get("transcript"))
-                quip["operatorId"] = self.ModernWarfare.GetOperatorID(
-                    entry.get("operatorRef")
-                )
-                quip["operatorAltId"] = entry.get("operatorRef")
-                quip["image"] = entry.get("lootImage")
+        for quip, entry in Utility.Join(self, quips, table, "altId", "ref"):
+            quip["name"] = self.localize.get(entry.get("name"))
+            quip["description"] = self.localize.get(entry.get("transcript"))
+            quip["operatorId"] = self.ModernWarfare.GetOperatorID(
+                entry.get("operatorRef")
+            )
+            quip["operatorAltId"] = entry.get("operatorRef")
+            quip["image"] = entry.get("lootImage")
 
         return quips
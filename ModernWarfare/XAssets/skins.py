@@ -1,6 +1,7 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
+from table import Table
 from utility import Utility
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -52,7 +53,14 @@ class OperatorSkins(TypedDict):
 class Skins:
     """Skin XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/operator_skin_ids.csv",
+        "{iXAssets}/operatorskins.csv",
+        "{iXAssets}/loot/operator_ids.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/operatorSkins.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Skin XAssets."""
 
         skins: List[Dict[str, Any]] = []
@@ -64,28 +72,36 @@ class Skins:
 
         log.info(f"Compiled {len(skins):,} Operator Skins")
 
+        return skins
+
     def IDs(self: Any, skins: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/operator_skin_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
+        ids: Table = Utility.ReadTable(
             self, f"{self.iXAssets}/loot/operator_skin_ids.csv", OperatorSkinIDs
         )
 
         if ids is None:
             return skins
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(ids.Column("id"))
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            ids.Column("quality")
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            ids.Column("unlockMethod")
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             skins.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
                     "description": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("quality")),
-                    "season": self.ModernWarfare.GetLootSeason(
-                        entry.get("unlockMethod")
-                    ),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "operatorId": None,
                     "operatorAltId": None,
                     "image": None,
@@ -105,23 +121,19 @@ class Skins:
         if table is None:
             return skins
 
-        for skin in skins:
-            for entry in table:
-                if skin.get("altId") != entry.get("ref"):
-                    continue
-
-                skin["name"] = self.localize.get(entry.get("name"))
-                skin["description"] = self.localize.get(entry.get("desc"))
-                skin["image"] = entry.get("lootImage")
-
-                if bool(entry.get("isGlobal")) is True:
-                    skin["operatorId"] = self.ModernWarfare.GetOperatorID(
-                        "universal_base_ref"
-                    )
-                    skin["operatorAltId"] = "universal_base_ref"
-                else:
-                    ref: str = entry.get("operatorRef")
-                    skin["operatorId"] = self.ModernWarfare.GetOperatorID(ref)
-                    skin["operatorAltId"] = ref
+        for skin, entry in Utility.Join(self, skins, table, "altId", "ref"):
+            skin["name"] = self.localize.get(entry.get("name"))
+            skin["description"] = self.localize.get(entry.get("desc"))
+            skin["image"] = entry.get("lootImage")
+
+            if bool(entry.get("isGlobal")) is True:
+                skin["operatorId"] = self.ModernWarfare.GetOperatorID(
+                    "universal_base_ref"
+                )
+                skin["operatorAltId"] = "universal_base_ref"
+            else:
+                ref: str = entry.get("operatorRef")
+                skin["operatorId"] = self.ModernWarfare.GetOperatorID(ref)
+                skin["operatorAltId"] = ref
 
         return skins
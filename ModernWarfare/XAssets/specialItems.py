@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -20,7 +20,10 @@ class SpecialIDs(TypedDict):
 class SpecialItems:
     """Special Item XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/loot/special_ids.csv"]
+    outputs: List[str] = ["{eXAssets}/specialItems.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Special Item XAssets."""
 
         items: List[Dict[str, Any]] = []
@@ -31,6 +34,8 @@ class SpecialItems:
 
         log.info(f"Compiled {len(items):,} Special Items")
 
+        return items
+
     def IDs(self: Any, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/special_ids.csv XAsset."""
 
@@ -41,15 +46,25 @@ class SpecialItems:
         if ids is None:
             return items
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             items.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": self.localize.get(entry.get("name")),
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "image": entry.get("image"),
                     "background": "ui_loot_bg_generic",
                 }
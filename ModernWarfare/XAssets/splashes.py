@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, Iterator, List, TypedDict
 
 from utility import Utility
 
@@ -45,7 +45,10 @@ class SplashTable(TypedDict):
 class Splashes:
     """Splash XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/mp/splashtable.csv"]
+    outputs: List[str] = ["{eXAssets}/splashes.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Splash XAssets."""
 
         splashes: List[Dict[str, Any]] = []
@@ -56,16 +59,15 @@ class Splashes:
 
         log.info(f"Compiled {len(splashes):,} Splashes")
 
+        return splashes
+
     def Table(self: Any, splashes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/splashtable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Iterator[Dict[str, Any]] = Utility.StreamCSV(
             self, f"{self.iXAssets}/mp/splashtable.csv", SplashTable
         )
 
-        if table is None:
-            return splashes
-
         for entry in table:
             splashes.append(
                 {
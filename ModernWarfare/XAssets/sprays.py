@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -34,7 +34,13 @@ class SprayTable(TypedDict):
 class Sprays:
     """Spray XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/sprays_ids.csv",
+        "{iXAssets}/mp/spraytable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/sprays.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Spray XAssets."""
 
         sprays: List[Dict[str, Any]] = []
@@ -46,6 +52,8 @@ class Sprays:
 
         log.info(f"Compiled {len(sprays):,} Sprays")
 
+        return sprays
+
     def IDs(self: Any, sprays: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/sprays_ids.csv XAsset."""
 
@@ -56,15 +64,25 @@ class Sprays:
         if ids is None:
             return sprays
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             sprays.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "hidden": None,
                     "image": None,
                     "background": "ui_loot_bg_spray",
@@ -83,13 +101,9 @@ class Sprays:
         if table is None:
             return sprays
 
-        for spray in sprays:
-            for entry in table:
-                if spray.get("altId") != entry.get("ref"):
-                    continue
-
-                spray["name"] = self.localize.get(entry.get("name"))
-                spray["hidden"] = bool(entry.get("hideInUI"))
-                spray["image"] = entry.get("image")
+        for spray, entry in Utility.Join(self, sprays, table, "altId", "ref"):
+            spray["name"] = self.localize.get(entry.get("name"))
+            spray["hidden"] = bool(entry.get("hideInUI"))
+            spray["image"] = entry.get("image")
 
         return sprays
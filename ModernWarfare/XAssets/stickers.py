@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -36,7 +36,13 @@ class WeaponStickerTable(TypedDict):
 class Stickers:
     """Sticker XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/sticker_ids.csv",
+        "{iXAssets}/mp/weaponstickertable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/stickers.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Sticker XAssets."""
 
         stickers: List[Dict[str, Any]] = []
@@ -48,6 +54,8 @@ class Stickers:
 
         log.info(f"Compiled {len(stickers):,} Weapon Stickers")
 
+        return stickers
+
     def IDs(self: Any, stickers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/sticker_ids.csv XAsset."""
 
@@ -58,15 +66,25 @@ class Stickers:
         if ids is None:
             return stickers
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             stickers.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "hidden": None,
                     "image": None,
                     "background": "ui_loot_bg_sticker",
@@ -85,13 +103,9 @@ class Stickers:
         if table is None:
             return stickers
 
-        for sticker in stickers:
-            for entry in table:
-                if sticker.get("altId") != entry.get("ref"):
-                    continue
-
-                sticker["name"] = self.localize.get(entry.get("name"))
-                sticker["hidden"] = bool(entry.get("hideInUI"))
-                sticker["image"] = entry.get("image")
+        for sticker, entry in Utility.Join(self, stickers, table, "altId", "ref"):
+            sticker["name"] = self.localize.get(entry.get("name"))
+            sticker["hidden"] = bool(entry.get("hideInUI"))
+            sticker["image"] = entry.get("image")
 
         return stickers
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -39,7 +39,13 @@ class VehicleCamosTable(TypedDict):
 class VehicleCamos:
     """Vehicle Camo XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/vehicle_camo_ids.csv",
+        "{iXAssets}/mp_cp/vehiclecamos.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/vehicleCamos.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Vehicle Camo XAssets."""
 
         camos: List[Dict[str, Any]] = []
@@ -51,6 +57,8 @@ class VehicleCamos:
 
         log.info(f"Compiled {len(camos):,} Vehicle Camos")
 
+        return camos
+
     def IDs(self: Any, camos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/vehicle_camo_ids.csv XAsset."""
 
@@ -61,16 +69,26 @@ class VehicleCamos:
         if ids is None:
             return camos
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             camos.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
                     "flavor": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "unlock": None,
                     "attribute": None,
                     "hidden": None,
@@ -91,22 +109,16 @@ class VehicleCamos:
         if table is None:
             return camos
 
-        for camo in camos:
-            for entry in table:
-                if camo.get("altId") != entry.get("ref"):
-                    continue
-
-                camo["name"] = self.localize.get(entry.get("name"))
-                camo["flavor"] = self.localize.get(entry.get("flavorText"))
-                camo["unlock"] = self.localize.get(entry.get("unlockText"))
-                camo["attribute"] = self.ModernWarfare.GetAttribute(
-                    entry.get("specialAttribute")
-                )
-                camo["hidden"] = bool(entry.get("hideInUI"))
-                camo["image"] = (
-                    None
-                    if (i := entry.get("showcaseImage")) == "ui_default_white"
-                    else i
-                )
+        for camo, entry in Utility.Join(self, camos, table, "altId", "ref"):
+            camo["name"] = self.localize.get(entry.get("name"))
+            camo["flavor"] = self.localize.get(entry.get("flavorText"))
+            camo["unlock"] = self.localize.get(entry.get("unlockText"))
+            camo["attribute"] = self.ModernWarfare.GetAttribute(
+                entry.get("specialAttribute")
+            )
+            camo["hidden"] = bool(entry.get("hideInUI"))
+            camo["image"] = (
+                None if (i := entry.get("showcaseImage")) == "ui_default_white" else i
+            )
 
         return camos
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -45,7 +45,13 @@ class VehicleHornsTable(TypedDict):
 class VehicleHorns:
     """Vehicle Horn XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/vehicle_horn_ids.csv",
+        "{iXAssets}/mp_cp/vehiclehorns.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/vehicleHorns.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Vehicle Horn XAssets."""
 
         horns: List[Dict[str, Any]] = []
@@ -57,6 +63,8 @@ class VehicleHorns:
 
         log.info(f"Compiled {len(horns):,} Vehicle Horns")
 
+        return horns
+
     def IDs(self: Any, horns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/vehicle_horn_ids.csv XAsset."""
 
@@ -67,16 +75,26 @@ class VehicleHorns:
         if ids is None:
             return horns
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             horns.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
                     "flavor": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "unlock": None,
                     "hidden": None,
                     "image": "ui_vehicle_horn",
@@ -96,14 +114,10 @@ class VehicleHorns:
         if table is None:
             return horns
 
-        for horn in horns:
-            for entry in table:
-                if horn.get("altId") != entry.get("ref"):
-                    continue
-
-                horn["name"] = self.localize.get(entry.get("name"))
-                horn["flavor"] = self.localize.get(entry.get("flavorText"))
-                horn["unlock"] = self.localize.get(entry.get("unlockText"))
-                horn["hidden"] = bool(entry.get("hideInUI"))
+        for horn, entry in Utility.Join(self, horns, table, "altId", "ref"):
+            horn["name"] = self.localize.get(entry.get("name"))
+            horn["flavor"] = self.localize.get(entry.get("flavorText"))
+            horn["unlock"] = self.localize.get(entry.get("unlockText"))
+            horn["hidden"] = bool(entry.get("hideInUI"))
 
         return horns
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, TypedDict
+from typing import Any, Dict, List, Optional, TypedDict
 
 from utility import Utility
 
@@ -39,7 +39,13 @@ class VehicleTracksTable(TypedDict):
 class VehicleTracks:
     """Vehicle Tracks XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/loot/vehicle_track_ids.csv",
+        "{iXAssets}/mp_cp/vehicletracks.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/vehicleTracks.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Vehicle Track XAssets."""
 
         tracks: List[Dict[str, Any]] = []
@@ -51,6 +57,8 @@ class VehicleTracks:
 
         log.info(f"Compiled {len(tracks):,} Vehicle Tracks")
 
+        return tracks
+
     def IDs(self: Any, tracks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/vehicle_track_ids.csv XAsset."""
 
@@ -61,15 +69,25 @@ class VehicleTracks:
         if ids is None:
             return tracks
 
-        for entry in ids:
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            [entry.get("id") for entry in ids]
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            [entry.get("rarity") for entry in ids]
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            [entry.get("license") for entry in ids]
+        )
+
+        for entry, lootType, rarity, season in zip(ids, types, rarities, seasons):
             tracks.append(
                 {
                     "id": entry.get("id"),
                     "altId": entry.get("ref"),
                     "name": None,
-                    "type": self.ModernWarfare.GetLootType(entry.get("id")),
-                    "rarity": self.ModernWarfare.GetLootRarity(entry.get("rarity")),
-                    "season": self.ModernWarfare.GetLootSeason(entry.get("license")),
+                    "type": lootType,
+                    "rarity": rarity,
+                    "season": season,
                     "unlock": None,
                     "hidden": None,
                     "image": "ui_vehicle_battle_track",
@@ -89,13 +107,9 @@ class VehicleTracks:
         if table is None:
             return tracks
 
-        for track in tracks:
-            for entry in table:
-                if track.get("altId") != entry.get("ref"):
-                    continue
-
-                track["name"] = self.localize.get(entry.get("name"))
-                track["unlock"] = self.localize.get(entry.get("unlockText"))
-                track["hidden"] = bool(entry.get("hideInUI"))
+        for track, entry in Utility.Join(self, tracks, table, "altId", "ref"):
+            track["name"] = self.localize.get(entry.get("name"))
+            track["unlock"] = self.localize.get(entry.get("unlockText"))
+            track["hidden"] = bool(entry.get("hideInUI"))
 
         return tracks
@@ -22,7 +22,10 @@ class VehicleTable(TypedDict):
 class Vehicles:
     """Vehicle XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = ["{iXAssets}/mp_cp/vehicletable.csv"]
+    outputs: List[str] = ["{eXAssets}/vehicles.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Vehicle XAssets."""
 
         vehicles: List[Dict[str, Any]] = []
@@ -33,6 +36,8 @@ class Vehicles:
 
         log.info(f"Compiled {len(vehicles):,} Vehicles")
 
+        return vehicles
+
     def Table(self: Any, vehicles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp_cp/vehicletable.csv XAsset."""
 
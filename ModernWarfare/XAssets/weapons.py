@@ -1,6 +1,7 @@
 import logging
-from typing import Any, Dict, List, TypedDict, Union
+from typing import Any, Dict, List, Optional, TypedDict, Union
 
+from table import Table
 from utility import Utility
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -181,22 +182,37 @@ class AttachmentTable(TypedDict):
 class Weapons:
     """Weapon XAssets."""
 
-    def Compile(self: Any) -> None:
+    inputs: List[str] = [
+        "{iXAssets}/mp/statstable.csv",
+        "{iXAssets}/loot/weapon_ids.csv",
+        "{iXAssets}/mp/gunsmith/*_variants.csv",
+        "{iXAssets}/mp/gunsmith/*_progression.csv",
+        "{iXAssets}/loot/*_attachment_ids.csv",
+        "{iXAssets}/mp/attachmenttable.csv",
+        "{iXAssets}/mp/weaponClassTable.csv",
+        "{iXAssets}/mp/attachmentcategorytable.csv",
+    ]
+    outputs: List[str] = ["{eXAssets}/weapons.json"]
+
+    def Compile(self: Any) -> List[Dict[str, Any]]:
         """Compile the Weapon XAssets."""
 
         weapons: List[Dict[str, Any]] = []
+        gunsmith: Dict[str, Any] = Weapons.Gunsmith(self)
 
         weapons = Weapons.Table(self, weapons)
         weapons = Weapons.IDs(self, weapons)
-        weapons = Weapons.Variants(self, weapons)
-        weapons = Weapons.Progression(self, weapons)
-        weapons = Weapons.Attachments(self, weapons)
+        weapons = Weapons.Variants(self, weapons, gunsmith)
+        weapons = Weapons.Progression(self, weapons, gunsmith)
+        weapons = Weapons.Attachments(self, weapons, gunsmith)
         weapons = Weapons.AttachmentTable(self, weapons)
 
         Utility.WriteFile(self, f"{self.eXAssets}/weapons.json", weapons)
 
         log.info(f"Compiled {len(weapons):,} Weapons")
 
+        return weapons
+
     def Table(self: Any, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the mp/statstable.csv XAsset."""
 
@@ -262,27 +278,35 @@ class Weapons:
     def IDs(self: Any, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Compile the loot/weapon_ids.csv XAsset."""
 
-        ids: List[Dict[str, Any]] = Utility.ReadCSV(
+        ids: Table = Utility.ReadTable(
             self, f"{self.iXAssets}/loot/weapon_ids.csv", WeaponIDs
         )
 
         if ids is None:
             return weapons
 
+        types: List[Optional[str]] = self.ModernWarfare.GetLootTypes(
+            ids.Column("index")
+        )
+        rarities: List[Optional[str]] = self.ModernWarfare.GetLootRarities(
+            ids.Column("quality")
+        )
+        seasons: List[Optional[str]] = self.ModernWarfare.GetLootSeasons(
+            ids.Column("license")
+        )
+        refs: Dict[Any, List[int]] = ids.Index("baseRef")
+
+        # The loot values are resolved for the whole table at once, so the
+        # rows of each weapon are looked up by index.
         for weapon in weapons:
-            for entry in ids:
-                if weapon.get("altId") != entry.get("baseRef"):
-                    continue
+            for i in refs.get(weapon.get("altId"), []):
+                entry: Dict[str, Any] = ids.Row(i)
 
                 if entry.get("quality") == 0:
                     weapon["id"] = entry.get("index")
-                    weapon["type"] = self.ModernWarfare.GetLootType(entry.get("index"))
-                    weapon["rarity"] = self.ModernWarfare.GetLootRarity(
-                        entry.get("quality")
-                    )
-                    weapon["season"] = self.ModernWarfare.GetLootSeason(
-                        entry.get("license")
-                    )
+                    weapon["type"] = types[i]
+                    weapon["rarity"] = rarities[i]
+                    weapon["season"] = seasons[i]
                 else:
                     weapon["variants"].append(
                         {
@@ -290,13 +314,9 @@ class Weapons:
                             "altId": entry.get("variantRef"),
                             "name": None,
                             "flavor": None,
-                            "type": self.ModernWarfare.GetLootType(entry.get("index")),
-                            "rarity": self.ModernWarfare.GetLootRarity(
-                                entry.get("quality")
-                            ),
-                            "season": self.ModernWarfare.GetLootSeason(
-                                entry.get("license")
-                            ),
+                            "type": types[i],
+                            "rarity": rarities[i],
+                            "season": seasons[i],
                             "tracers": None,
                             "dismemberment": None,
                             "image": None,
@@ -305,41 +325,76 @@ class Weapons:
 
         return weapons
 
-    def Variants(self: Any, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Compile the mp/gunsmith/*_*_variants.csv XAssets."""
+    def Gunsmith(self: Any) -> Dict[str, Any]:
+        """
+        Scan the mp/gunsmith/ and loot/ directories once and index the
+        variants, progression and attachment ids files by every prefix of
+        their filename which ends with an underscore.
+        """
+
+        gunsmith: Dict[str, Any] = {
+            "files": {"_variants": {}, "_progression": {}, "_attachment_ids": {}},
+            "tables": {},
+        }
+        directories: Dict[str, List[str]] = {
+            f"{self.iXAssets}/mp/gunsmith/": ["_variants", "_progression"],
+            f"{self.iXAssets}/loot/": ["_attachment_ids"],
+        }
+
+        for directory, suffixes in directories.items():
+            for file in Utility.GetMatchingFiles(self, directory, "csv", None, None):
+                filename: str = file.split("\\")[-1].split(".")[0]
+
+                for suffix in suffixes:
+                    if filename.endswith(suffix) is False:
+                        continue
 
-        files: List[str] = Utility.GetMatchingFiles(
-            self, f"{self.iXAssets}/mp/gunsmith/", "csv", None, "_variants"
-        )
+                    parts: List[str] = filename.split("_")
+                    index: Dict[str, List[str]] = gunsmith["files"][suffix]
+
+                    for i in range(1, len(parts)):
+                        index.setdefault("_".join(parts[:i]) + "_", []).append(file)
+
+        return gunsmith
+
+    def ReadGunsmith(
+        self: Any, gunsmith: Dict[str, Any], file: str, types: TypedDict
+    ) -> Table:
+        """Read the specified gunsmith file, parsing it only once."""
+
+        if (table := gunsmith["tables"].get(file)) is None:
+            table = gunsmith["tables"][file] = Utility.ReadTable(self, file, types)
+
+        return table
+
+    def Variants(
+        self: Any, weapons: List[Dict[str, Any]], gunsmith: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Compile the mp/gunsmith/*_*_variants.csv XAssets."""
 
         for weapon in weapons:
             if (altId := weapon.get("altId")) is None:
                 continue
 
-            for file in files:
-                refPartial: str = altId.replace("iw8_", "") + "_"
-                filePartial: str = file.split("\\")[-1].split(".")[0]
-
-                if filePartial.startswith(refPartial) is False:
-                    continue
+            refPartial: str = altId.replace("iw8_", "") + "_"
 
-                table: List[Dict[str, Any]] = Utility.ReadCSV(
-                    self, file, WeaponVariants
+            for file in gunsmith["files"]["_variants"].get(refPartial, []):
+                table: Table = Weapons.ReadGunsmith(
+                    self, gunsmith, file, WeaponVariants
                 )
 
                 if table is None:
                     continue
 
-                for entry in table:
-                    if entry.get("variantID") == 0:
-                        weapon["image"] = entry.get("image")
-
-                    for variant in weapon.get("variants", []):
-                        if variant.get("altId") != entry.get("ref"):
-                            continue
+                for entry in table.FindAll("variantID", 0):
+                    weapon["image"] = entry.get("image")
 
-                        flavor: str = variant.get("altId").replace("iw8_", "").replace(
-                            "variant_", ""
+                for variant in weapon.get("variants", []):
+                    for entry in table.FindAll("ref", variant.get("altId")):
+                        flavor: str = (
+                            variant.get("altId")
+                            .replace("iw8_", "")
+                            .replace("variant_", "")
                         )
 
                         variant["name"] = self.localize.get(entry.get("name"))
@@ -356,37 +411,29 @@ class Weapons:
 
         return weapons
 
-    def Progression(self, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def Progression(
+        self: Any, weapons: List[Dict[str, Any]], gunsmith: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         """Compile the mp/gunsmith/*_*_progression.csv XAssets."""
 
-        files: List[str] = Utility.GetMatchingFiles(
-            self, f"{self.iXAssets}/mp/gunsmith/", "csv", None, "_progression"
-        )
-
         for weapon in weapons:
             if (wAltId := weapon.get("altId")) is None:
                 continue
 
-            for file in files:
-                refPartial: str = wAltId.replace("iw8_", "") + "_"
-                filePartial: str = file.split("\\")[-1].split(".")[0]
+            refPartial: str = wAltId.replace("iw8_", "") + "_"
 
-                if filePartial.startswith(refPartial) is False:
-                    continue
-
-                table: List[Dict[str, Any]] = Utility.ReadCSV(
-                    self, file, WeaponProgression
+            for file in gunsmith["files"]["_progression"].get(refPartial, []):
+                table: Table = Weapons.ReadGunsmith(
+                    self, gunsmith, file, WeaponProgression
                 )
 
                 if table is None:
                     continue
 
-                for entry in table:
-                    if entry.get("lootID") is None:
-                        continue
-                    elif entry.get("level") < 0:
-                        continue
-
+                for entry in table.Filter(
+                    lambda entry: (entry.get("lootID") is not None)
+                    and (entry.get("level") >= 0)
+                ):
                     weapon["attachments"].append(
                         {
                             "id": entry.get("lootID"),
@@ -404,35 +451,25 @@ class Weapons:
 
         return weapons
 
-    def Attachments(self: Any, weapons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def Attachments(
+        self: Any, weapons: List[Dict[str, Any]], gunsmith: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         """Compile the loot/iw8_*_*_attachment_ids.csv XAssets."""
 
-        files: List[str] = Utility.GetMatchingFiles(
-            self, f"{self.iXAssets}/loot/", "csv", None, "_attachment_ids"
-        )
-
         for weapon in weapons:
             if (wAltId := weapon.get("altId")) is None:
                 continue
 
-            for file in files:
-                filePartial: str = file.split("\\")[-1].split(".")[0]
-
-                if filePartial.startswith(wAltId + "_") is False:
-                    continue
-
-                table: List[Dict[str, Any]] = Utility.ReadCSV(self, file, AttachmentIDs)
+            for file in gunsmith["files"]["_attachment_ids"].get(wAltId + "_", []):
+                table: Table = Weapons.ReadGunsmith(self, gunsmith, file, AttachmentIDs)
 
                 if table is None:
                     continue
 
-                for attachment in weapon.get("attachments"):
-                    for entry in table:
-                        if entry.get("ref") is None:
-                            continue
-                        elif attachment.get("id") != entry.get("index"):
-                            continue
+                refs: Table = table.Filter(lambda entry: entry.get("ref") is not None)
 
+                for attachment in weapon.get("attachments"):
+                    for entry in refs.FindAll("index", attachment.get("id")):
                         attachment["altId"] = entry.get("ref")
 
         return weapons
@@ -442,71 +479,92 @@ class Weapons:
     ) -> List[Dict[str, Any]]:
         """Compile the mp/attachmenttable.csv XAsset."""
 
-        table: List[Dict[str, Any]] = Utility.ReadCSV(
+        table: Table = Utility.ReadTable(
             self, f"{self.iXAssets}/mp/attachmenttable.csv", AttachmentTable
         )
 
         if table is None:
             return weapons
 
+        index: Dict[Any, List[int]] = table.Index("ref")
+        decoded: Dict[int, Dict[str, Any]] = {}
+
         for weapon in weapons:
             for attachment in weapon.get("attachments"):
-                if attachment.get("altId") is None:
+                if (altId := attachment.get("altId")) is None:
                     continue
 
-                for entry in table:
-                    weaponPartial: str = weapon.get("altId").split("_")[-1]
+                weaponPartial: str = weapon.get("altId").split("_")[-1]
 
-                    if attachment.get("altId") + "_" + weaponPartial == entry.get(
-                        "ref"
-                    ):
-                        pass
-                    elif attachment.get("altId") == entry.get("ref"):
-                        pass
-                    else:
-                        continue
+                # Rows are applied in table order, regardless of which of
+                # the two references they matched.
+                for i in sorted(
+                    index.get(f"{altId}_{weaponPartial}", []) + index.get(altId, [])
+                ):
+                    if (entry := decoded.get(i)) is None:
+                        entry = decoded[i] = Weapons.DecodeAttachment(
+                            self, table.Row(i)
+                        )
 
-                    attachment["name"] = self.localize.get(entry.get("name"))
-                    attachment["description"] = self.localize.get(entry.get("desc"))
-                    attachment["type"] = self.ModernWarfare.GetAttachmentCategory(
-                        entry.get("category")
-                    )
+                    attachment["name"] = entry.get("name")
+                    attachment["description"] = entry.get("description")
+                    attachment["type"] = entry.get("type")
                     attachment["image"] = entry.get("image")
+                    attachment["attributes"].extend(
+                        [dict(a) for a in entry.get("attributes")]
+                    )
+                    attachment["statBars"].extend(
+                        [dict(b) for b in entry.get("statBars")]
+                    )
 
-                    for i in range(1, 9):
-                        if (mod := entry.get(f"modifier{i}")) is None:
-                            continue
+        return weapons
 
-                        mod: List[str] = mod.split("|")
-                        modVal: Union[int, str] = int(mod[1])
+    def DecodeAttachment(self: Any, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode the provided mp/attachmenttable.csv row for reuse."""
 
-                        if modVal == 1:
-                            modVal = "+"
-                        elif modVal == -1:
-                            modVal = "-"
+        attachment: Dict[str, Any] = {
+            "name": self.localize.get(entry.get("name")),
+            "description": self.localize.get(entry.get("desc")),
+            "type": self.ModernWarfare.GetAttachmentCategory(entry.get("category")),
+            "image": entry.get("image"),
+            "attributes": [],
+            "statBars": [],
+        }
 
-                        attachment["attributes"].append(
-                            {"label": self.localize.get(mod[0]), "value": modVal}
-                        )
+        for i in range(1, 9):
+            if (mod := entry.get(f"modifier{i}")) is None:
+                continue
 
-                    statLabels: List[str] = [
-                        "LUA_MENU/WEAPSTATS_ACCURACY",
-                        "LUA_MENU/WEAPSTATS_DAMAGE",
-                        "LUA_MENU/WEAPSTATS_RANGE",
-                        "LUA_MENU/WEAPSTATS_ROF",
-                        "LUA_MENU/WEAPSTATS_MOBILITY",
-                        "LUA_MENU/WEAPSTATS_CONTROL",
-                    ]
-                    statValues: List[str] = ["acc", "dam", "rng", "rof", "mob", "ctl"]
-
-                    for label, value in zip(statLabels, statValues):
-                        if (value := entry.get(value)) is None:
-                            continue
-                        elif value == 0.0:
-                            continue
-
-                        attachment["statBars"].append(
-                            {"label": self.localize.get(label), "value": value}
-                        )
+            mod: List[str] = mod.split("|")
+            modVal: Union[int, str] = int(mod[1])
 
-        return weapons
+            if modVal == 1:
+                modVal = "+"
+            elif modVal == -1:
+                modVal = "-"
+
+            attachment["attributes"].append(
+                {"label": self.localize.get(mod[0]), "value": modVal}
+            )
+
+        statLabels: List[str] = [
+            "LUA_MENU/WEAPSTATS_ACCURACY",
+            "LUA_MENU/WEAPSTATS_DAMAGE",
+            "LUA_MENU/WEAPSTATS_RANGE",
+            "LUA_MENU/WEAPSTATS_ROF",
+            "LUA_MENU/WEAPSTATS_MOBILITY",
+            "LUA_MENU/WEAPSTATS_CONTROL",
+        ]
+        statValues: List[str] = ["acc", "dam", "rng", "rof", "mob", "ctl"]
+
+        for label, value in zip(statLabels, statValues):
+            if (value := entry.get(value)) is None:
+                continue
+            elif value == 0.0:
+                continue
+
+            attachment["statBars"].append(
+                {"label": self.localize.get(label), "value": value}
+            )
+
+        return attachment
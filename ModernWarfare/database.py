@@ -1,8 +1,28 @@
+import gzip
+import json
 import logging
-from typing import Any, Dict, List
+import os
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from utility import Utility
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from .localize import Localize
+from .manifest import Manifest
+
 log: logging.Logger = logging.getLogger(__name__)
 
 
@@ -12,24 +32,265 @@ class Database:
     https://cod.tracker.gg/warzone/db
     """
 
+    # The images directory is an input as items without an image are
+    # excluded from the database.
+    inputs: List[str] = [
+        "{iImages}",
+        "{eXAssets}/accessories.json",
+        "{eXAssets}/battlePasses.json",
+        "{eXAssets}/battlePassItems.json",
+        "{eXAssets}/bundles.json",
+        "{eXAssets}/callingCards.json",
+        "{eXAssets}/camos.json",
+        "{eXAssets}/charms.json",
+        "{eXAssets}/consumables.json",
+        "{eXAssets}/emblems.json",
+        "{eXAssets}/executions.json",
+        "{eXAssets}/features.json",
+        "{eXAssets}/gestures.json",
+        "{eXAssets}/missionItems.json",
+        "{eXAssets}/operatorQuips.json",
+        "{eXAssets}/operators.json",
+        "{eXAssets}/operatorSkins.json",
+        "{eXAssets}/specialItems.json",
+        "{eXAssets}/sprays.json",
+        "{eXAssets}/stickers.json",
+        "{eXAssets}/vehicleCamos.json",
+        "{eXAssets}/vehicleHorns.json",
+        "{eXAssets}/vehicleTracks.json",
+        "{eXAssets}/weapons.json",
+        "{eXAssets}/masteryChallenges.json",
+        "{eXAssets}/miscChallenges.json",
+        "{eXAssets}/officerChallenges.json",
+        "{eXAssets}/turboChallenges.json",
+        "{eXAssets}/weaponUnlockChallenges.json",
+        "{eXAssets}/weeklyChallengesBR.json",
+        "{eXAssets}/weeklyChallengesMP.json",
+    ]
+    outputs: List[str] = [
+        "{eDatabase}/battlePasses.json",
+        "{eDatabase}/_battlePasses.json",
+        "{eDatabase}/bundles.json",
+        "{eDatabase}/_bundles.json",
+        "{eDatabase}/loot.json",
+        "{eDatabase}/_loot.json",
+        "{eDatabase}/operators.json",
+        "{eDatabase}/_operators.json",
+        "{eDatabase}/weapons.json",
+        "{eDatabase}/_weapons.json",
+        "{eDatabase}/_images.txt",
+    ]
+
+    # Configuration which changes the Database outputs.
+    settings: List[str] = ["animateImages", "precompress", "shards", "sqlite"]
+
+    # Database shares its state with the main process, thus it must not
+    # be compiled by a parallel worker.
+    parallel: bool = False
+
     def Compile(self: Any) -> None:
         """Compile the XAssets for the COD Tracker Database."""
 
         self.dbImages: List[str] = []
+        self.dbItems: Dict[str, List[Dict[str, Any]]] = {}
         self.count: int = 0
 
+        # Outputs are written by a background thread while the following
+        # stages compile, which is safe as stages only modify copies.
+        self.dbWriter: Optional[ThreadPoolExecutor] = None
+        self.dbWrites: List[Future] = []
+
+        if self.parallel.get("enabled") is True:
+            self.dbWriter = ThreadPoolExecutor(max_workers=1)
+
+        self.dbCompressors: Dict[str, Callable[[bytes], bytes]] = {}
+
+        if (precompress := self.config.get("precompress", {})).get("enabled") is True:
+            self.dbCompressors = Database.GetCompressors(
+                self, precompress.get("formats", ["gz", "br", "zst"])
+            )
+
         DBBattlePasses.Compile(self)
         DBBundles.Compile(self)
         DBLoot.Compile(self)
         DBOperators.Compile(self)
         DBWeapons.Compile(self)
 
+        if self.dbWriter is not None:
+            for write in self.dbWrites:
+                try:
+                    write.result()
+                except Exception as e:
+                    log.error(f"Failed to write Database output, {e}")
+
+            self.dbWriter.shutdown(wait=True)
+
+        if self.config.get("sqlite", {}).get("enabled") is True:
+            DBSQLite.Compile(self)
+
         Utility.WriteFile(
-            self, f"{self.eDatabase}/_images.txt", ",".join(list(set(self.dbImages)))
+            self, f"{self.eDatabase}/_images.txt", ",".join(sorted(set(self.dbImages)))
         )
 
+        self.registry.clear()
+
         log.info(f"Compiled {self.count:,} Database Items")
 
+    def Outputs(self: Any) -> List[str]:
+        """
+        Return the outputs of the Database for the current configuration,
+        which adds the precompressed files, loot shards, and SQLite export
+        to the static outputs when they are enabled.
+        """
+
+        outputs: List[str] = list(Database.outputs)
+
+        if (precompress := self.config.get("precompress", {})).get("enabled") is True:
+            compressors: Dict[str, Callable[[bytes], bytes]] = Database.GetCompressors(
+                self, precompress.get("formats", ["gz", "br", "zst"]), False
+            )
+
+            for path in Database.outputs:
+                if path.rsplit("/", 1)[1].startswith("_") is False:
+                    outputs.extend(f"{path}.{extension}" for extension in compressors)
+
+        if self.config.get("shards", {}).get("enabled") is True:
+            outputs.append("{eDatabase}/loot/manifest.json")
+
+        if self.config.get("sqlite", {}).get("enabled") is True:
+            outputs.append("{eDatabase}/database.sqlite")
+
+        return outputs
+
+    def Load(self: Any, filename: str) -> List[Dict[str, Any]]:
+        """
+        Return the specified compiled XAsset, preferring the in-memory
+        registry and falling back to reading it from disk. Items from the
+        registry are shared with other stages, thus a stage must copy an
+        item before modifying it. Items read from disk carry the values of
+        the additional languages in which they were rendered.
+        """
+
+        path: str = f"{self.eXAssets}/{filename}"
+
+        if (xasset := self.registry.get(path)) is not None:
+            return xasset
+
+        if (xasset := Utility.ReadFile(self, path)) is None:
+            return
+
+        translations: Dict[str, Any] = {
+            name: Utility.ReadFile(self, f"{self.eXAssets}/{name}/{filename}")
+            for name in getattr(self, "languages", {})
+        }
+
+        return Localize.Restore(self, xasset, translations)
+
+    def Write(
+        self: Any,
+        filename: str,
+        items: List[Dict[str, Any]],
+        key: Optional[str] = None,
+        key2: Optional[str] = None,
+    ) -> None:
+        """
+        Sort the provided items by the specified keys, if any, and write
+        them to both the compressed and pretty-printed (underscore-prefixed)
+        variants of the specified file in a single traversal.
+        """
+
+        if key is not None:
+            items = Utility.SortList(self, items, key, key2=key2)
+
+        self.dbItems[filename] = items
+
+        compressed: str = f"{self.eDatabase}/{filename}"
+        pretty: str = f"{self.eDatabase}/_{filename}"
+
+        if self.dbWriter is None:
+            Database.Output(self, items, compressed, pretty)
+        else:
+            self.dbWrites.append(
+                self.dbWriter.submit(Database.Output, self, items, compressed, pretty)
+            )
+
+    def Output(
+        self: Any, items: List[Dict[str, Any]], compressed: str, pretty: str
+    ) -> None:
+        """
+        Write the provided items to the specified files and precompress the
+        compressed variant, including those of the additional languages.
+        """
+
+        Utility.WriteJSON(self, items, compressed, pretty)
+
+        if len(self.dbCompressors) == 0:
+            return
+
+        Database.Precompress(self, compressed)
+
+        for language in self.languages:
+            Database.Precompress(self, f"/{language}/".join(compressed.rsplit("/", 1)))
+
+    def GetCompressors(
+        self: Any, formats: List[str], warn: bool = True
+    ) -> Dict[str, Callable[[bytes], bytes]]:
+        """
+        Return a compression function for each of the specified formats
+        which is available, at its maximum compression level.
+        """
+
+        compressors: Dict[str, Callable[[bytes], bytes]] = {}
+
+        for extension in formats:
+            if extension == "gz":
+                # A constant timestamp keeps the output identical between runs.
+                compressors[extension] = lambda data: gzip.compress(data, 9, mtime=0)
+            elif (extension == "br") and (brotli is not None):
+                compressors[extension] = lambda data: brotli.compress(data, quality=11)
+            elif (extension == "zst") and (zstandard is not None):
+                compressors[extension] = zstandard.ZstdCompressor(level=22).compress
+            elif warn is True:
+                log.warning(f"Unable to precompress Database outputs as {extension}")
+
+        return compressors
+
+    def Precompress(self: Any, path: str) -> None:
+        """
+        Write a compressed sibling of the specified file in each of the
+        configured formats, unless the sibling is newer than the file.
+        Unchanged files keep their modification time, so only changed files
+        are recompressed.
+        """
+
+        try:
+            modified: int = os.stat(path).st_mtime_ns
+        except Exception as e:
+            log.error(f"Failed to precompress file {path}, {e}")
+
+            return
+
+        data: Optional[bytes] = None
+
+        for extension, compress in self.dbCompressors.items():
+            sibling: str = f"{path}.{extension}"
+
+            if Path(sibling).is_file() and (os.stat(sibling).st_mtime_ns >= modified):
+                continue
+
+            try:
+                if data is None:
+                    data = Path(path).read_bytes()
+
+                with open(Utility.TempPath(self, sibling), "wb") as file:
+                    file.write(compress(data))
+
+                Utility.CommitFile(self, sibling)
+            except Exception as e:
+                log.error(f"Failed to precompress file {sibling}, {e}")
+
+                Utility.DiscardFile(self, sibling)
+
 
 class DBBattlePasses:
     """Battle Pass XAssets for the COD Tracker Database."""
@@ -38,32 +299,29 @@ class DBBattlePasses:
         """Compile the Battle Pass XAssets for the COD Tracker Database."""
 
         dbPasses: List[Dict[str, Any]] = []
-        passes: List[Dict[str, Any]] = Utility.ReadFile(
-            self, f"{self.eXAssets}/battlePasses.json"
-        )
+        passes: List[Dict[str, Any]] = Database.Load(self, "battlePasses.json")
 
         for battlePass in passes:
             if battlePass.get("name") is None:
                 continue
 
+            battlePass = dict(battlePass)
             items: List[Dict[str, Any]] = []
 
             for item in battlePass.get("items"):
+                item = dict(item)
+
                 item.pop("type")
                 item.pop("billboard")
 
                 items.append(item)
 
+            battlePass["items"] = items
+
             dbPasses.append(battlePass)
             self.count += 1
 
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/battlePasses.json",
-            dbPasses,
-            compress=True,
-        )
-        Utility.WriteFile(self, f"{self.eDatabase}/_battlePasses.json", dbPasses)
+        Database.Write(self, "battlePasses.json", dbPasses)
 
 
 class DBBundles:
@@ -73,9 +331,7 @@ class DBBundles:
         """Compile the Bundle XAssets for the COD Tracker Database."""
 
         dbBundles: List[Dict[str, Any]] = []
-        bundles: List[Dict[str, Any]] = Utility.ReadFile(
-            self, f"{self.eXAssets}/bundles.json"
-        )
+        bundles: List[Dict[str, Any]] = Database.Load(self, "bundles.json")
 
         for bundle in bundles:
             if bundle.get("id") is None:
@@ -100,6 +356,7 @@ class DBBundles:
             for item in bundle.get("items"):
                 items.append(item.get("id"))
 
+            bundle = dict(bundle)
             bundle["items"] = items
 
             bundle.pop("altId")
@@ -121,17 +378,7 @@ class DBBundles:
             dbBundles.append(bundle)
             self.count += 1
 
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/bundles.json",
-            Utility.SortList(self, dbBundles, "name", key2="type"),
-            compress=True,
-        )
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/_bundles.json",
-            Utility.SortList(self, dbBundles, "name", key2="type"),
-        )
+        Database.Write(self, "bundles.json", dbBundles, "name", "type")
 
 
 class DBLoot:
@@ -164,9 +411,7 @@ class DBLoot:
         ]
 
         for file in loot:
-            items: List[Dict[str, Any]] = Utility.ReadFile(
-                self, f"{self.eXAssets}/{file}.json"
-            )
+            items: List[Dict[str, Any]] = Database.Load(self, f"{file}.json")
 
             for item in items:
                 if item.get("id") is None:
@@ -181,6 +426,8 @@ class DBLoot:
                 if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
                     continue
 
+                item = dict(item)
+
                 item.pop("altId", None)
                 item.pop("hidden", None)
                 item.pop("category", None)
@@ -210,9 +457,7 @@ class DBLoot:
                 dbLoot.append(item)
                 self.count += 1
 
-        weapons: List[Dict[str, Any]] = Utility.ReadFile(
-            self, f"{self.eXAssets}/weapons.json"
-        )
+        weapons: List[Dict[str, Any]] = Database.Load(self, "weapons.json")
 
         for weapon in weapons:
             for variant in weapon.get("variants"):
@@ -228,6 +473,8 @@ class DBLoot:
                 if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
                     continue
 
+                variant = dict(variant)
+
                 variant.pop("altId")
 
                 if variant.get("flavor") is None:
@@ -246,17 +493,109 @@ class DBLoot:
                 dbLoot.append(variant)
                 self.count += 1
 
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/loot.json",
-            Utility.SortList(self, dbLoot, "name", key2="rarity"),
-            compress=True,
-        )
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/_loot.json",
-            Utility.SortList(self, dbLoot, "name", key2="rarity"),
-        )
+        Database.Write(self, "loot.json", dbLoot, "name", "rarity")
+
+        if (shards := self.config.get("shards", {})).get("enabled") is True:
+            size: Any = shards.get("pageSize", 500)
+
+            if (isinstance(size, int) is False) or (size <= 0):
+                log.warning(f"Invalid loot page size {size}, defaulting to 500")
+
+                size = 500
+
+            if self.dbWriter is None:
+                DBLoot.Shard(self, self.dbItems["loot.json"], size)
+            else:
+                self.dbWrites.append(
+                    self.dbWriter.submit(
+                        DBLoot.Shard, self, self.dbItems["loot.json"], size
+                    )
+                )
+
+    def Shard(self: Any, items: List[Dict[str, Any]], size: int) -> None:
+        """
+        Write the provided sorted loot items to the loot directory as one
+        shard per type and season and as pages of the specified size,
+        alongside a manifest of their names, counts and hashes. Shards and
+        pages which are no longer produced are removed.
+        """
+
+        directory: str = f"{self.eDatabase}/loot"
+        shards: Dict[Tuple[Optional[str], Optional[str]], List[Dict[str, Any]]] = {}
+        files: Dict[str, List[Dict[str, Any]]] = {}
+        manifest: Dict[str, Any] = {
+            "count": len(items),
+            "pageSize": size,
+            "shards": [],
+            "pages": [],
+        }
+
+        for item in items:
+            shards.setdefault((item.get("type"), item.get("season")), []).append(item)
+
+        for (lootType, season), shard in shards.items():
+            slug: str = "_".join(
+                Utility.Sluggify(self, "none" if v is None else v)
+                for v in [lootType, season]
+            )
+            name: str = f"{slug}.json"
+
+            # Distinct types and seasons may share a slug.
+            while name in files:
+                name = f"{slug}-{len(files)}.json"
+
+            files[name] = shard
+            manifest["shards"].append(
+                {
+                    "name": name,
+                    "type": None if lootType is None else str(lootType),
+                    "season": None if season is None else str(season),
+                    "count": len(shard),
+                }
+            )
+
+        for i in range(0, len(items), size):
+            name: str = f"page_{i // size + 1}.json"
+
+            files[name] = items[i : i + size]
+            manifest["pages"].append({"name": name, "count": len(files[name])})
+
+        for name, contents in files.items():
+            Utility.WriteJSON(self, contents, f"{directory}/{name}", delta=False)
+
+        for language in [None, *self.languages]:
+            path: str = directory if language is None else f"{directory}/{language}"
+
+            for entry in manifest["shards"] + manifest["pages"]:
+                entry["hash"] = Manifest.Hash(
+                    self, f"{path}/{entry['name']}", memoize=False
+                )
+
+                if entry["hash"] is None:
+                    log.error(f"Failed to hash file {path}/{entry['name']}")
+
+            Utility.WriteJSON(self, manifest, f"{path}/manifest.json", render=False)
+
+            try:
+                stale: List[str] = [
+                    name
+                    for name in os.listdir(path)
+                    if name.endswith(".json")
+                    and (name != "manifest.json")
+                    and (name not in files)
+                ]
+            except Exception as e:
+                log.error(f"Failed to list directory {path}, {e}")
+
+                continue
+
+            for name in stale:
+                try:
+                    os.remove(f"{path}/{name}")
+                except Exception as e:
+                    log.error(f"Failed to remove file {path}/{name}, {e}")
+
+        log.info(f"Sharded {len(items):,} Loot Items into {len(files):,} files")
 
 
 class DBOperators:
@@ -266,18 +605,10 @@ class DBOperators:
         """Compile the Operator XAssets for the COD Tracker Database."""
 
         dbOperators: List[Dict[str, Any]] = []
-        operators: List[Dict[str, Any]] = Utility.ReadFile(
-            self, f"{self.eXAssets}/operators.json"
-        )
-        skins: List[Dict[str, Any]] = Utility.ReadFile(
-            self, f"{self.eXAssets}/operatorSkins.json"
-        )
-        executions: List[Dict[str, Any]] = Utility.ReadFile(
-            self, f"{self.eXAssets}/executions.json"
-        )
-        quips: List[Dict[str, Any]] = Utility.ReadFile(
-            self, f"{self.eXAssets}/operatorQuips.json"
-        )
+        operators: List[Dict[str, Any]] = Database.Load(self, "operators.json")
+        skins: List[Dict[str, Any]] = Database.Load(self, "operatorSkins.json")
+        executions: List[Dict[str, Any]] = Database.Load(self, "executions.json")
+        quips: List[Dict[str, Any]] = Database.Load(self, "operatorQuips.json")
 
         for operator in operators:
             if operator.get("id") is None:
@@ -292,6 +623,8 @@ class DBOperators:
             if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
                 continue
 
+            operator = dict(operator)
+
             operator.pop("altId")
             operator.pop("type")
             operator.pop("rarity")
@@ -378,17 +711,7 @@ class DBOperators:
             dbOperators.append(operator)
             self.count += 1
 
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/operators.json",
-            Utility.SortList(self, dbOperators, "name", key2="faction"),
-            compress=True,
-        )
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/_operators.json",
-            Utility.SortList(self, dbOperators, "name", key2="faction"),
-        )
+        Database.Write(self, "operators.json", dbOperators, "name", "faction")
 
 
 class DBWeapons:
@@ -398,9 +721,7 @@ class DBWeapons:
         """Compile the Weapon XAssets for the COD Tracker Database."""
 
         dbWeapons: List[Dict[str, Any]] = []
-        weapons: List[Dict[str, Any]] = Utility.ReadFile(
-            self, f"{self.eXAssets}/weapons.json"
-        )
+        weapons: List[Dict[str, Any]] = Database.Load(self, "weapons.json")
 
         for weapon in weapons:
             if weapon.get("id") is None:
@@ -420,6 +741,7 @@ class DBWeapons:
             elif Utility.FileExists(self, f"{self.iImages}/{ico}.png") is False:
                 continue
 
+            weapon = dict(weapon)
             variants: List[int] = []
 
             for variant in Utility.SortList(
@@ -451,6 +773,8 @@ class DBWeapons:
                 if Utility.FileExists(self, f"{self.iImages}/{i}.png") is False:
                     continue
 
+                attachment = dict(attachment)
+
                 attachment.pop("altId")
                 attachment.pop("unlock")
 
@@ -473,14 +797,226 @@ class DBWeapons:
             dbWeapons.append(weapon)
             self.count += 1
 
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/weapons.json",
-            Utility.SortList(self, dbWeapons, "name", key2="altName"),
-            compress=True,
-        )
-        Utility.WriteFile(
-            self,
-            f"{self.eDatabase}/_weapons.json",
-            Utility.SortList(self, dbWeapons, "name", key2="altName"),
+        Database.Write(self, "weapons.json", dbWeapons, "name", "altName")
+
+
+class DBSQLite:
+    """SQLite export of the COD Tracker Database."""
+
+    # Columns of each table, alongside their types. Every table also stores
+    # the complete item as JSON in its data column.
+    tables: Dict[str, Dict[str, str]] = {
+        "loot": {
+            "id": "INTEGER",
+            "name": "TEXT",
+            "type": "TEXT",
+            "rarity": "TEXT",
+            "season": "TEXT",
+            "slug": "TEXT",
+            "image": "TEXT",
+            "class": "TEXT",
+            "baseId": "INTEGER",
+        },
+        "weapons": {
+            "id": "INTEGER",
+            "altId": "TEXT",
+            "name": "TEXT",
+            "altName": "TEXT",
+            "type": "TEXT",
+            "rarity": "TEXT",
+            "season": "TEXT",
+            "class": "TEXT",
+            "slug": "TEXT",
+            "image": "TEXT",
+        },
+        "weaponVariants": {"weaponId": "INTEGER", "id": "INTEGER"},
+        "attachments": {
+            "weaponId": "INTEGER",
+            "id": "INTEGER",
+            "name": "TEXT",
+            "type": "TEXT",
+            "rarity": "TEXT",
+            "image": "TEXT",
+        },
+        "operators": {
+            "id": "INTEGER",
+            "name": "TEXT",
+            "season": "TEXT",
+            "faction": "TEXT",
+            "branch": "TEXT",
+            "slug": "TEXT",
+            "image": "TEXT",
+        },
+        "operatorItems": {"operatorId": "INTEGER", "id": "INTEGER", "type": "TEXT"},
+        "bundles": {
+            "id": "INTEGER",
+            "name": "TEXT",
+            "type": "TEXT",
+            "season": "TEXT",
+            "price": "INTEGER",
+            "slug": "TEXT",
+        },
+        "bundleItems": {"bundleId": "INTEGER", "id": "INTEGER"},
+        "battlePasses": {"season": "TEXT"},
+        "battlePassItems": {
+            "season": "TEXT",
+            "id": "INTEGER",
+            "tier": "INTEGER",
+            "free": "INTEGER",
+            "codPoints": "INTEGER",
+        },
+        "challenges": {
+            "type": "TEXT",
+            "id": "INTEGER",
+            "altId": "TEXT",
+            "name": "TEXT",
+            "season": "INTEGER",
+            "week": "INTEGER",
+            "xp": "INTEGER",
+        },
+    }
+
+    # Columns which are indexed wherever they are present.
+    indexes: List[str] = ["id", "altId", "slug", "type", "rarity", "season"]
+
+    # Compiled challenge XAssets, alongside their type.
+    challenges: Dict[str, str] = {
+        "masteryChallenges.json": "Mastery",
+        "miscChallenges.json": "Miscellaneous",
+        "officerChallenges.json": "Officer",
+        "turboChallenges.json": "Turbo",
+        "weaponUnlockChallenges.json": "Weapon Unlock",
+        "weeklyChallengesBR.json": "Weekly (BR)",
+        "weeklyChallengesMP.json": "Weekly (MP)",
+    }
+
+    def Compile(self: Any) -> None:
+        """
+        Export the compiled Database items to normalized SQLite tables,
+        inserting every row within a single transaction.
+        """
+
+        rows: Dict[str, List[Tuple[Any, ...]]] = {
+            table: [] for table in DBSQLite.tables
+        }
+
+        for item in self.dbItems.get("loot.json", []):
+            rows["loot"].append(DBSQLite.Row(self, "loot", item))
+
+        for weapon in self.dbItems.get("weapons.json", []):
+            rows["weapons"].append(DBSQLite.Row(self, "weapons", weapon))
+
+            for variant in weapon.get("variants"):
+                rows["weaponVariants"].append(
+                    DBSQLite.Row(
+                        self,
+                        "weaponVariants",
+                        {"weaponId": weapon.get("id"), "id": variant},
+                    )
+                )
+
+            for attachment in weapon.get("attachments"):
+                rows["attachments"].append(
+                    DBSQLite.Row(
+                        self,
+                        "attachments",
+                        {"weaponId": weapon.get("id"), **attachment},
+                    )
+                )
+
+        for operator in self.dbItems.get("operators.json", []):
+            rows["operators"].append(DBSQLite.Row(self, "operators", operator))
+
+            for key in ["skins", "executions", "quips"]:
+                for item in operator.get(key):
+                    rows["operatorItems"].append(
+                        DBSQLite.Row(
+                            self,
+                            "operatorItems",
+                            {"operatorId": operator.get("id"), "id": item, "type": key},
+                        )
+                    )
+
+        for bundle in self.dbItems.get("bundles.json", []):
+            rows["bundles"].append(DBSQLite.Row(self, "bundles", bundle))
+
+            for item in bundle.get("items"):
+                rows["bundleItems"].append(
+                    DBSQLite.Row(
+                        self, "bundleItems", {"bundleId": bundle.get("id"), "id": item}
+                    )
+                )
+
+        for battlePass in self.dbItems.get("battlePasses.json", []):
+            season: Optional[str] = battlePass.get("name")
+
+            rows["battlePasses"].append(
+                DBSQLite.Row(self, "battlePasses", {"season": season, **battlePass})
+            )
+
+            for item in battlePass.get("items"):
+                rows["battlePassItems"].append(
+                    DBSQLite.Row(self, "battlePassItems", {"season": season, **item})
+                )
+
+        for filename, challengeType in DBSQLite.challenges.items():
+            for challenge in Database.Load(self, filename) or []:
+                rows["challenges"].append(
+                    DBSQLite.Row(
+                        self, "challenges", {**challenge, "type": challengeType}
+                    )
+                )
+
+        path: str = f"{self.eDatabase}/database.sqlite"
+
+        # A temporary file left behind by a failed export would otherwise
+        # already contain the tables.
+        Utility.DiscardFile(self, path)
+
+        try:
+            with closing(
+                sqlite3.connect(Utility.TempPath(self, path), isolation_level=None)
+            ) as connection:
+                connection.execute("BEGIN")
+
+                for table, columns in DBSQLite.tables.items():
+                    definition: str = ", ".join(
+                        f'"{column}" {kind}' for column, kind in columns.items()
+                    )
+                    values: str = ", ".join(["?"] * (len(columns) + 1))
+
+                    connection.execute(
+                        f'CREATE TABLE "{table}" ({definition}, "data" TEXT)'
+                    )
+                    connection.executemany(
+                        f'INSERT INTO "{table}" VALUES ({values})', rows[table]
+                    )
+
+                    for column in [c for c in DBSQLite.indexes if c in columns]:
+                        connection.execute(
+                            f'CREATE INDEX "{table}_{column}" ON "{table}" ("{column}")'
+                        )
+
+                connection.execute("COMMIT")
+
+            Utility.CommitFile(self, path)
+        except Exception as e:
+            log.error(f"Failed to write file {path}, {e}")
+
+            Utility.DiscardFile(self, path)
+
+            return
+
+        log.info(
+            f"Exported {sum(len(r) for r in rows.values()):,} Database rows to SQLite"
         )
+
+    def Row(self: Any, table: str, item: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Return the values of the specified table's columns for the provided
+        item, followed by the complete item as JSON.
+        """
+
+        values: List[Any] = [item.get(column) for column in DBSQLite.tables[table]]
+
+        return (*values, json.dumps(item, ensure_ascii=False))
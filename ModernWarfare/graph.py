@@ -0,0 +1,131 @@
+import logging
+from glob import glob
+from typing import Any, Dict, List, Set
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class Graph:
+    """
+    Dependency graph of XAsset compilers, built from the inputs and
+    outputs which each compiler declares.
+    """
+
+    def Build(self: Any, compilers: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Build the dependency graph for the provided compilers. A compiler
+        requires another when one of its inputs is an output of the other.
+        """
+
+        graph: Dict[str, Dict[str, Any]] = {}
+        producers: Dict[str, str] = {}
+
+        for compiler in compilers:
+            inputs: List[str] = []
+
+            for path in self.shared + compiler.inputs:
+                path = Graph.Resolve(self, path)
+
+                if "*" in path:
+                    inputs.extend(sorted(glob(path)))
+                else:
+                    inputs.append(path)
+
+            # Compilers whose outputs depend upon the configuration declare
+            # them using an Outputs function instead.
+            if (declare := getattr(compiler, "Outputs", None)) is not None:
+                outputs: List[str] = [Graph.Resolve(self, p) for p in declare(self)]
+            else:
+                outputs = [Graph.Resolve(self, p) for p in compiler.outputs]
+
+            for path in outputs:
+                if (producer := producers.get(path)) is not None:
+                    log.error(
+                        f"{compiler.__name__} and {producer} both declare output {path}"
+                    )
+
+                producers[path] = compiler.__name__
+
+            graph[compiler.__name__] = {
+                "compiler": compiler,
+                "inputs": inputs,
+                "outputs": outputs,
+                "settings": {
+                    key: self.config.get(key)
+                    for key in self.settings + getattr(compiler, "settings", [])
+                },
+                "requires": set(),
+            }
+
+        for node in graph.values():
+            for path in node.get("inputs"):
+                if (producer := producers.get(path)) is not None:
+                    node["requires"].add(producer)
+
+        return graph
+
+    def Resolve(self: Any, path: str) -> str:
+        """Substitute the configured directories into the provided path."""
+
+        return path.format(
+            iXAssets=self.iXAssets,
+            iImages=self.iImages,
+            eXAssets=self.eXAssets,
+            eDatabase=self.eDatabase,
+        )
+
+    def Subgraph(
+        self: Any, graph: Dict[str, Dict[str, Any]], names: Set[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the portion of the provided graph containing only the
+        specified compilers. Requirements outside of it are considered
+        already satisfied.
+        """
+
+        return {
+            name: dict(node, requires=node.get("requires") & names)
+            for name, node in graph.items()
+            if name in names
+        }
+
+    def Order(self: Any, graph: Dict[str, Dict[str, Any]]) -> List[List[str]]:
+        """
+        Return the compilers of the provided graph grouped into stages,
+        each of which depends only upon the stages before it.
+        """
+
+        stages: List[List[str]] = []
+        complete: Set[str] = set()
+        remaining: List[str] = list(graph)
+
+        while len(remaining) > 0:
+            stage: List[str] = [
+                name
+                for name in remaining
+                if graph[name].get("requires").issubset(complete)
+            ]
+
+            if len(stage) == 0:
+                raise ValueError(f"Dependency cycle between {', '.join(remaining)}")
+
+            stages.append(stage)
+            complete.update(stage)
+            remaining = [name for name in remaining if name not in complete]
+
+        return stages
+
+    def Plan(self: Any, graph: Dict[str, Dict[str, Any]]) -> None:
+        """Log the compilation plan for the provided graph without running it."""
+
+        for i, stage in enumerate(Graph.Order(self, graph), 1):
+            log.info(f"Stage {i}: {len(stage):,} XAssets")
+
+            for name in stage:
+                node: Dict[str, Any] = graph[name]
+                requires: str = ", ".join(sorted(node.get("requires"))) or "None"
+
+                log.info(
+                    f"    {name}: {len(node.get('inputs')):,} inputs, "
+                    f"{len(node.get('outputs')):,} outputs, requires {requires}"
+                )
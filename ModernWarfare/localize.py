@@ -0,0 +1,256 @@
+import logging
+from itertools import islice
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utility import Utility
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class Text(str):
+    """
+    Localized string which retains the key of its localized string entry,
+    so that it may be rendered in another language. The string methods
+    which XAssets use to derive values are recorded, so that they may be
+    repeated on the value in another language. Text read from a compiled
+    file has no key, instead it carries its previously rendered values.
+    """
+
+    def __new__(
+        cls: Any,
+        value: str,
+        key: Optional[str],
+        transforms: Tuple[Tuple[str, Tuple[Any, ...]], ...] = (),
+        translations: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        text: Text = str.__new__(cls, value)
+        text.key = key
+        text.transforms = transforms
+        text.translations = {} if translations is None else translations
+
+        return text
+
+    def __reduce__(self: Any) -> Tuple[Any, Tuple[Any, ...]]:
+        return (Text, (str(self), self.key, self.transforms, self.translations))
+
+    def Transform(self: Any, method: str, *args: Any) -> Any:
+        """Return the result of the specified string method as Text."""
+
+        return Text(
+            getattr(str, method)(self, *args),
+            self.key,
+            self.transforms + ((method, args),),
+            self.translations,
+        )
+
+    def capitalize(self: Any) -> Any:
+        return Text.Transform(self, "capitalize")
+
+    def lower(self: Any) -> Any:
+        return Text.Transform(self, "lower")
+
+    def replace(self: Any, *args: Any) -> Any:
+        return Text.Transform(self, "replace", *args)
+
+    def strip(self: Any, *args: Any) -> Any:
+        return Text.Transform(self, "strip", *args)
+
+    def title(self: Any) -> Any:
+        return Text.Transform(self, "title")
+
+    def upper(self: Any) -> Any:
+        return Text.Transform(self, "upper")
+
+
+class Localize:
+    """
+    Lazy mapping of the localized string entries for Modern Warfare. An
+    entry is filtered and stripped of color codes the first time that it is
+    requested, and every requested key is recorded so that only the entries
+    which were used need to be cached.
+    """
+
+    def __init__(
+        self: Any,
+        path: str,
+        placeholders: List[str],
+        resolved: Optional[Dict[str, Optional[str]]] = None,
+        symbolic: bool = False,
+        name: Optional[str] = None,
+    ) -> None:
+        self.path: str = path
+        self.name: Optional[str] = name
+        self.symbolic: bool = symbolic
+        self.groups: List[Tuple[int, Set[str]]] = Localize.Group(self, placeholders)
+        self.entries: Optional[Dict[str, Optional[str]]] = None
+        self.resolved: Dict[str, Optional[str]] = {} if resolved is None else resolved
+        self.cached: int = len(self.resolved)
+
+    def get(self: Any, key: str, default: Any = None) -> Optional[str]:
+        """
+        Get the filtered value of the specified localized string entry. The
+        value is returned as Text if the mapping is symbolic.
+        """
+
+        if key in self.resolved:
+            value: Optional[str] = self.resolved[key]
+        else:
+            value = self.resolved[key] = Localize.Filter(
+                self, Localize.Entries(self).get(key)
+            )
+
+        if value is None:
+            return default
+        elif self.symbolic is True:
+            return Text(value, key)
+
+        return value
+
+    def Render(self: Any, contents: Any) -> Any:
+        """
+        Return a copy of the provided contents with every Text substituted
+        by its value in this mapping, or its previously rendered value in
+        this language. Text without either keeps its original value.
+        """
+
+        if isinstance(contents, Text):
+            if (value := contents.translations.get(self.name)) is None:
+                if contents.key is None:
+                    return str(contents)
+                elif (value := Localize.get(self, contents.key)) is None:
+                    return str(contents)
+
+            value = str(value)
+
+            for method, args in contents.transforms:
+                value = getattr(str, method)(value, *args)
+
+            return value
+        elif isinstance(contents, dict):
+            return {key: Localize.Render(self, v) for key, v in contents.items()}
+        elif isinstance(contents, list):
+            return [Localize.Render(self, v) for v in contents]
+
+        return contents
+
+    def Restore(self: Any, contents: Any, translations: Dict[str, Any]) -> Any:
+        """
+        Return a copy of the provided compiled contents with every string
+        that differs in the provided rendered copies, keyed by language,
+        substituted by Text which carries those values.
+        """
+
+        if isinstance(contents, str):
+            values: Dict[str, str] = {
+                name: v
+                for name, v in translations.items()
+                if isinstance(v, str) and (v != contents)
+            }
+
+            if len(values) == 0:
+                return contents
+
+            return Text(contents, None, translations=values)
+        elif isinstance(contents, dict):
+            return {
+                key: Localize.Restore(
+                    self,
+                    v,
+                    {
+                        n: t.get(key)
+                        for n, t in translations.items()
+                        if isinstance(t, dict)
+                    },
+                )
+                for key, v in contents.items()
+            }
+        elif isinstance(contents, list):
+            return [
+                Localize.Restore(
+                    self,
+                    v,
+                    {
+                        n: t[i]
+                        for n, t in translations.items()
+                        if isinstance(t, list) and (len(t) == len(contents))
+                    },
+                )
+                for i, v in enumerate(contents)
+            ]
+
+        return contents
+
+    def Entries(self: Any) -> Dict[str, Optional[str]]:
+        """
+        Get the unfiltered localized string entries, which are only read
+        once a key is requested that has not already been resolved.
+        """
+
+        if self.entries is None:
+            # Concurrent threads may both read the file, the result is the
+            # same either way.
+            entries: Optional[dict] = Utility.ReadFile(self, self.path)
+
+            self.entries = {} if entries is None else entries
+
+        return self.entries
+
+    def Filter(self: Any, value: Optional[str]) -> Optional[str]:
+        """
+        Return None if the provided value is empty or a placeholder,
+        otherwise return the value stripped of color codes.
+        """
+
+        if (value is None) or (value == ""):
+            return
+        elif Localize.IsPlaceholder(self, value.lower()) is True:
+            return
+
+        return Utility.StripColorCodes(self, value)
+
+    def Group(self: Any, placeholders: List[str]) -> List[Tuple[int, Set[str]]]:
+        """
+        Group the provided placeholders by length, so a string is tested
+        with two set lookups per distinct length rather than once per
+        placeholder.
+        """
+
+        lengths: Dict[int, Set[str]] = {}
+
+        for placeholder in placeholders:
+            lengths.setdefault(len(p := placeholder.lower()), set()).add(p)
+
+        return sorted(lengths.items())
+
+    def IsPlaceholder(self: Any, value: str) -> bool:
+        """
+        Determine whether the provided lowercase string starts or ends with
+        any of the placeholders.
+        """
+
+        for length, group in self.groups:
+            if length == 0:
+                # Every string starts with an empty placeholder.
+                return True
+            elif length > len(value):
+                break
+            elif (value[:length] in group) or (value[-length:] in group):
+                return True
+
+        return False
+
+    def Used(self: Any, start: int = 0) -> Dict[str, Optional[str]]:
+        """
+        Get the filtered values of every key which has been requested, or
+        only those requested after the first start keys.
+        """
+
+        if start == 0:
+            return self.resolved
+
+        return dict(islice(self.resolved.items(), start, None))
+
+    def Merge(self: Any, resolved: Dict[str, Optional[str]]) -> None:
+        """Merge the keys which were requested using another copy."""
+
+        self.resolved.update(resolved)
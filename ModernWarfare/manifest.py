@@ -0,0 +1,165 @@
+import hashlib
+import inspect
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from utility import Utility
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class Manifest:
+    """
+    Persisted record of the content hashes of every compiler's inputs,
+    outputs, and source code, alongside its configuration, used to
+    recompile only what has changed.
+    """
+
+    def Load(self: Any) -> Dict[str, Dict[str, Any]]:
+        """Load the build manifest from the previous compilation, if any."""
+
+        if Utility.FileExists(self, self.manifest) is False:
+            return {}
+
+        manifest: Optional[Dict[str, Any]] = Utility.ReadFile(self, self.manifest)
+
+        if manifest is None:
+            return {}
+
+        return manifest.get("compilers", {})
+
+    def Save(
+        self: Any,
+        graph: Dict[str, Dict[str, Any]],
+        previous: Dict[str, Dict[str, Any]],
+        compiled: Set[str],
+    ) -> None:
+        """
+        Save the build manifest, recording fresh hashes for the compilers
+        which succeeded and retaining the entries of those which were
+        skipped as up-to-date.
+        """
+
+        compilers: Dict[str, Dict[str, Any]] = {}
+
+        for name, node in graph.items():
+            if name in compiled:
+                compilers[name] = {
+                    "source": Manifest.Source(self, node.get("compiler")),
+                    "settings": node.get("settings"),
+                    "inputs": {p: Manifest.Hash(self, p) for p in node.get("inputs")},
+                    "outputs": {
+                        p: Manifest.Hash(self, p, False) for p in node.get("outputs")
+                    },
+                }
+            elif (entry := previous.get(name)) is not None:
+                compilers[name] = entry
+
+        Utility.WriteFile(self, self.manifest, {"compilers": compilers}, render=False)
+
+    def Dirty(
+        self: Any,
+        graph: Dict[str, Dict[str, Any]],
+        manifest: Dict[str, Dict[str, Any]],
+    ) -> Set[str]:
+        """
+        Return the names of the compilers whose source, configuration,
+        inputs, or outputs differ from the provided manifest, or which are
+        missing an output, along with everything that depends upon them.
+        """
+
+        dirty: Set[str] = set()
+
+        for name, node in graph.items():
+            entry: Dict[str, Any] = manifest.get(name, {})
+            inputs: Dict[str, Optional[str]] = entry.get("inputs", {})
+            outputs: Dict[str, Optional[str]] = entry.get("outputs", {})
+
+            if entry.get("source") != Manifest.Source(self, node.get("compiler")):
+                dirty.add(name)
+            elif entry.get("settings") != node.get("settings"):
+                dirty.add(name)
+            elif set(inputs) != set(node.get("inputs")):
+                dirty.add(name)
+            elif set(outputs) != set(node.get("outputs")):
+                dirty.add(name)
+            elif any(Manifest.Hash(self, p) != h for p, h in inputs.items()):
+                dirty.add(name)
+            elif any(Manifest.Hash(self, p) != h for p, h in outputs.items()):
+                dirty.add(name)
+            elif any(Manifest.Hash(self, p) is None for p in node.get("outputs")):
+                dirty.add(name)
+
+        for name, node in graph.items():
+            if Manifest.Requires(self, graph, name).isdisjoint(dirty) is False:
+                dirty.add(name)
+
+        return dirty
+
+    def Requires(self: Any, graph: Dict[str, Dict[str, Any]], name: str) -> Set[str]:
+        """Return every compiler which the specified compiler depends upon."""
+
+        requires: Set[str] = set()
+        queue: List[str] = list(graph[name].get("requires"))
+
+        while len(queue) > 0:
+            if (current := queue.pop()) in requires:
+                continue
+
+            requires.add(current)
+            queue.extend(graph[current].get("requires"))
+
+        return requires
+
+    def Source(self: Any, compiler: Any) -> str:
+        """
+        Return a hash of the source code which the specified compiler
+        relies upon, so that code changes also invalidate its outputs.
+        Compilers share helpers and feed one another, thus every module of
+        Hyde and the Modern Warfare package is included.
+        """
+
+        root: Path = Path(inspect.getsourcefile(Utility)).resolve().parent
+        files: List[str] = sorted(
+            {
+                str(Path(inspect.getsourcefile(compiler)).resolve()),
+                *(str(p) for p in root.glob("*.py")),
+                *(str(p) for p in root.joinpath("ModernWarfare").rglob("*.py")),
+            }
+        )
+
+        return hashlib.sha1(
+            "".join(Manifest.Hash(self, f) for f in files).encode("utf-8")
+        ).hexdigest()
+
+    def Hash(self: Any, path: str, memoize: bool = True) -> Optional[str]:
+        """
+        Return the content hash of the specified file. Directories are
+        hashed by the names of the files which they contain.
+        """
+
+        if (memoize is True) and ((digest := self.hashes.get(path)) is not None):
+            return digest
+
+        digest: Optional[str] = None
+        sha: Any = hashlib.sha1()
+
+        try:
+            if Path(path).is_dir():
+                for file in sorted(p.name for p in Path(path).iterdir()):
+                    sha.update(file.encode("utf-8") + b"\n")
+            else:
+                with open(path, "rb") as file:
+                    while chunk := file.read(1048576):
+                        sha.update(chunk)
+
+            digest = sha.hexdigest()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.error(f"Failed to hash file {path}, {e}")
+
+        self.hashes[path] = digest
+
+        return digest
@@ -1,9 +1,27 @@
 import logging
-from typing import Any, Dict, List, Optional, TypedDict
+import os
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Dict, List, Optional, Set, Tuple, TypedDict
 
 from utility import Utility
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from .database import Database
+from .graph import Graph
+from .localize import Localize
+from .manifest import Manifest
 from .XAssets import (
     Accessories,
     BattlePasses,
@@ -47,6 +65,9 @@ from .XAssets import (
 
 log: logging.Logger = logging.getLogger(__name__)
 
+# ModernWarfare instance used by the XAsset compilers of a worker.
+worker: Any = None
+
 
 class LootMaster(TypedDict):
     """Structure of loot/loot_master.csv"""
@@ -129,6 +150,16 @@ class CamoCategoryTable(TypedDict):
 class ModernWarfare:
     """Call of Duty: Modern Warfare (IW8)"""
 
+    # Inputs which are used by every XAsset compiler.
+    shared: List[str] = [
+        "{iXAssets}/localize.json",
+        "{iXAssets}/loot/loot_master.csv",
+        "ModernWarfare/placeholders.json",
+    ]
+
+    # Configuration which changes the outputs of every XAsset compiler.
+    settings: List[str] = ["delta", "languages"]
+
     def __init__(self: Any, config: dict) -> None:
         self.ModernWarfare = self
 
@@ -140,17 +171,113 @@ class ModernWarfare:
         self.eImages: str = self.config["export"]["images"]
         self.eVideos: str = self.config["export"]["videos"]
         self.eDatabase: str = self.config["export"]["database"]
+        self.parallel: Dict[str, Any] = self.config.get("parallel", {})
+        self.manifest: str = f"{self.eXAssets}/_manifest.json"
+        self.hashes: Dict[str, Optional[str]] = {}
+        self.registry: Dict[str, Any] = {}
+        self.references: Dict[str, Dict[str, Dict[Any, Dict[str, Any]]]] = {}
+        self.lookups: Counter = Counter()
+        self.writes: Counter = Counter()
+        self.iLanguages: Dict[str, str] = {}
+        self.languages: Dict[str, Localize] = {}
+
+        if (languages := self.config.get("languages", {})).get("enabled") is True:
+            self.iLanguages = languages.get("localize", {})
+
+        # Localized string entries of the additional languages are inputs of
+        # every XAsset compiler, as each of them renders its outputs.
+        self.shared: List[str] = ModernWarfare.shared + list(self.iLanguages.values())
 
     def Compile(self: Any) -> None:
         """Compile and export all supported XAsset types for Modern Warfare."""
 
         log.info("Compiling XAssets for Call of Duty: Modern Warfare...")
 
+        # Weapons is by far the most expensive XAsset, so it leads the list
+        # in order to prevent it from being the tail of a parallel compile.
+        compilers: List[Any] = [
+            Weapons,
+            Accessories,
+            BattlePasses,
+            BattlePassItems,
+            Bundles,
+            CallingCards,
+            Camos,
+            Charms,
+            Consumables,
+            Emblems,
+            Equipment,
+            Executions,
+            Features,
+            GameTypes,
+            Gestures,
+            ItemSources,
+            Killstreaks,
+            Maps,
+            MasteryChallenges,
+            MiscellaneousChallenges,
+            MissionItems,
+            Missions,
+            OfficerChallenges,
+            Operators,
+            Quips,
+            Skins,
+            SpecialItems,
+            Splashes,
+            Sprays,
+            Stickers,
+            TurboChallenges,
+            VehicleCamos,
+            VehicleHorns,
+            Vehicles,
+            VehicleTracks,
+            WeaponUnlockChallenges,
+            WeeklyChallengesBR,
+            WeeklyChallengesMP,
+        ]
+
+        if self.config.get("compileDatabase") is True:
+            compilers.append(Database)
+
+        graph: Dict[str, Dict[str, Any]] = Graph.Build(self, compilers)
+        previous: Dict[str, Dict[str, Any]] = {}
+        stale: Set[str] = set(graph)
+
+        if self.config.get("incremental") is True:
+            previous = Manifest.Load(self)
+            stale = Manifest.Dirty(self, graph, previous)
+
+            log.info(f"Skipping {len(graph) - len(stale):,} up-to-date XAssets")
+
+        build: Dict[str, Dict[str, Any]] = Graph.Subgraph(self, graph, stale)
+        stages: List[List[str]] = Graph.Order(self, build)
+
+        if self.config.get("dryRun") is True:
+            Graph.Plan(self, build)
+
+            return
+
+        if self.config.get("delta", {}).get("enabled") is True:
+            ModernWarfare.ClearDeltas(
+                self, [node for name, node in graph.items() if name not in stale]
+            )
+
+        if len(build) == 0:
+            return
+
+        # Compiled XAssets which are inputs of another compiler are kept in
+        # memory to spare the consumer from reading them back from disk.
+        self.consumed: Set[str] = {p for n in build.values() for p in n.get("inputs")}
+
         # Global and reused XAssets
-        self.localize: Dict[str, Optional[str]] = ModernWarfare.LoadLocalize(self)
+        self.languages: Dict[str, Localize] = ModernWarfare.LoadLanguages(self)
+        self.localize: Localize = ModernWarfare.LoadLocalize(self)
         self.lootTypes: List[Dict[str, Any]] = Utility.ReadCSV(
             self, f"{self.iXAssets}/loot/loot_master.csv", LootMaster, 1
         )
+        self.lootIndex: Tuple[
+            List[int], List[Optional[str]]
+        ] = ModernWarfare.IndexLootTypes(self)
         self.operatorIds: List[Dict[str, Any]] = Utility.ReadCSV(
             self, f"{self.iXAssets}/loot/operator_ids.csv", OperatorIDs
         )
@@ -166,93 +293,372 @@ class ModernWarfare:
             self, f"{self.iXAssets}/mp/camocategorytable.csv", CamoCategoryTable
         )
 
-        Accessories.Compile(self)
-        BattlePasses.Compile(self)
-        BattlePassItems.Compile(self)
-        Bundles.Compile(self)
-        CallingCards.Compile(self)
-        Camos.Compile(self)
-        Charms.Compile(self)
-        Consumables.Compile(self)
-        Emblems.Compile(self)
-        Equipment.Compile(self)
-        Executions.Compile(self)
-        Features.Compile(self)
-        GameTypes.Compile(self)
-        Gestures.Compile(self)
-        ItemSources.Compile(self)
-        Killstreaks.Compile(self)
-        Maps.Compile(self)
-        MasteryChallenges.Compile(self)
-        MiscellaneousChallenges.Compile(self)
-        MissionItems.Compile(self)
-        Missions.Compile(self)
-        OfficerChallenges.Compile(self)
-        Operators.Compile(self)
-        Quips.Compile(self)
-        Skins.Compile(self)
-        SpecialItems.Compile(self)
-        Splashes.Compile(self)
-        Sprays.Compile(self)
-        Stickers.Compile(self)
-        TurboChallenges.Compile(self)
-        VehicleCamos.Compile(self)
-        VehicleHorns.Compile(self)
-        Vehicles.Compile(self)
-        VehicleTracks.Compile(self)
-        Weapons.Compile(self)
-        WeaponUnlockChallenges.Compile(self)
-        WeeklyChallengesBR.Compile(self)
-        WeeklyChallengesMP.Compile(self)
+        ModernWarfare.IndexReference(self, "operatorIds", self.operatorIds, "ref")
+        ModernWarfare.IndexReference(self, "operatorIds", self.operatorIds, "id")
+        ModernWarfare.IndexReference(self, "weaponClasses", self.weaponClasses, "ref")
+        ModernWarfare.IndexReference(
+            self, "attachCategories", self.attachCategories, "ref"
+        )
+        ModernWarfare.IndexReference(self, "camoCategories", self.camoCategories, "ref")
 
-        if self.config.get("compileDatabase") is True:
-            Database.Compile(self)
+        if self.parallel.get("enabled") is True:
+            compiled: Set[str] = ModernWarfare.CompileParallel(self, build)
+        else:
+            compiled: Set[str] = set()
+
+            for stage in stages:
+                for name in stage:
+                    result: Any = build[name].get("compiler").Compile(self)
+
+                    ModernWarfare.Register(self, build[name], result)
+                    compiled.add(name)
+
+        for table in self.references:
+            hits: int = self.lookups[(table, "hits")]
+            misses: int = self.lookups[(table, "misses")]
+
+            log.info(f"Referenced {table} with {hits:,} hits and {misses:,} misses")
+
+        changed: int = self.writes["changed"]
+        written: int = changed + self.writes["unchanged"]
+
+        log.info(f"Changed {changed:,} of {written:,} written files")
+
+        ModernWarfare.SaveLocalize(self)
+
+        if self.config.get("incremental") is True:
+            Manifest.Save(self, graph, previous, compiled)
+
+    def CompileParallel(self: Any, graph: Dict[str, Dict[str, Any]]) -> Set[str]:
+        """
+        Compile the provided graph concurrently using a pool of workers,
+        starting each compiler as soon as the compilers it requires are
+        complete. Processes are used by default as the compilers are
+        CPU-bound. Return the names of the successfully compiled XAssets.
+        """
+
+        workers: int = self.parallel.get("workers", 4)
+        pool: Any = (
+            ThreadPoolExecutor
+            if self.parallel.get("processes") is False
+            else ProcessPoolExecutor
+        )
+        pending: Dict[str, Set[str]] = {
+            name: set(node.get("requires")) for name, node in graph.items()
+        }
+        running: Dict[Future, str] = {}
+        compiled: Set[str] = set()
+        states: Dict[int, Dict[str, Any]] = {}
+
+        log.info(f"Compiling {len(graph):,} XAssets using {workers:,} workers...")
+
+        # Worker processes receive the localized string entries alongside
+        # the instance, rather than each reading and parsing the files.
+        if pool is ProcessPoolExecutor:
+            for localize in [self.localize, *self.languages.values()]:
+                Localize.Entries(localize)
+
+        with pool(
+            max_workers=workers,
+            initializer=ModernWarfare.InitializeWorker,
+            initargs=(self,),
+        ) as executor, ThreadPoolExecutor(max_workers=1) as local:
+            while (len(pending) > 0) or (len(running) > 0):
+                for name in [n for n, r in pending.items() if len(r) == 0]:
+                    compiler: Any = graph[name].get("compiler")
+
+                    if getattr(compiler, "parallel", True) is False:
+                        future: Future = local.submit(compiler.Compile, self)
+                    elif pool is ThreadPoolExecutor:
+                        future: Future = executor.submit(compiler.Compile, self)
+                    else:
+                        future: Future = executor.submit(
+                            ModernWarfare.CompileWorker, compiler
+                        )
+
+                    running[future] = name
+                    pending.pop(name)
+
+                if len(running) == 0:
+                    log.error(
+                        f"Skipped {', '.join(pending)} due to failed requirements"
+                    )
+
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name: str = running.pop(future)
+
+                    try:
+                        result: Any = future.result()
+
+                        if (pool is ProcessPoolExecutor) and getattr(
+                            graph[name].get("compiler"), "parallel", True
+                        ):
+                            result, pid, states[pid] = result
+
+                            self.localize.Merge(states[pid].pop("localize"))
+
+                        ModernWarfare.Register(self, graph[name], result)
+                    except Exception as e:
+                        log.error(f"Failed to compile {name}, {e}")
+
+                        continue
+
+                    compiled.add(name)
+
+                    for requires in pending.values():
+                        requires.discard(name)
+
+        # Worker processes count reference lookups and written files against
+        # their own copy of the instance, threads count against this one.
+        for state in states.values():
+            self.lookups.update(state.get("lookups"))
+            self.writes.update(state.get("writes"))
+
+        return compiled
+
+    def Register(self: Any, node: Dict[str, Any], result: Any) -> None:
+        """
+        Store the result of the provided compiler in the in-memory registry
+        if another compiler consumes its output.
+        """
+
+        if result is None:
+            return
+
+        for path in node.get("outputs"):
+            if path in self.consumed:
+                self.registry[path] = result
+
+    def InitializeWorker(state: Any) -> None:
+        """Store the ModernWarfare instance for use by the current worker."""
+
+        global worker
+
+        worker = state
+
+    def CompileWorker(xasset: Any) -> Tuple[Any, int, Dict[str, Any]]:
+        """
+        Compile the provided XAsset using the current worker process's state.
+        Return the result alongside the worker's reference lookup and written
+        file counters and the localized strings which the XAsset newly used.
+        """
+
+        start: int = len(worker.localize.Used())
+        result: Any = xasset.Compile(worker)
+
+        return (
+            result,
+            os.getpid(),
+            {
+                "lookups": worker.lookups,
+                "writes": worker.writes,
+                "localize": worker.localize.Used(start),
+            },
+        )
+
+    def LoadLocalize(self: Any) -> Localize:
+        """
+        Load the localized string entries for Modern Warfare. Entries which
+        were used by a previous compile are restored from the cache while the
+        contents of localize.json and placeholders.json are unchanged, the
+        remainder are only read if they are requested.
+        """
+
+        sources: List[str] = [
+            f"{self.iXAssets}/localize.json",
+            "ModernWarfare/placeholders.json",
+        ]
+        placeholders: Optional[List[str]] = Utility.ReadFile(self, sources[1])
+        resolved: Optional[Dict[str, Optional[str]]] = None
+
+        if self.config.get("cache", {}).get("enabled") is True:
+            fingerprint: Tuple[Optional[str], ...] = tuple(
+                Manifest.Hash(self, path) for path in sources
+            )
+
+            if None not in fingerprint:
+                resolved = Utility.ReadCache(
+                    self, f"{sources[0]}:LoadLocalize", fingerprint
+                )
+
+        if resolved is not None:
+            log.info(f"Loaded {len(resolved):,} localized strings from cache")
+
+        # Values are returned as Text while additional languages are enabled,
+        # so that the compiled XAssets can be rendered in each of them.
+        return Localize(
+            sources[0], placeholders or [], resolved, len(self.languages) > 0
+        )
+
+    def LoadLanguages(self: Any) -> Dict[str, Localize]:
+        """
+        Load the localized string entries of the additional languages in
+        which the compiled XAssets are rendered.
+        """
 
-    def LoadLocalize(self: Any) -> Dict[str, Optional[str]]:
-        """Load and filter the localized string entries for Modern Warfare."""
+        if len(self.iLanguages) == 0:
+            return {}
 
-        localize: dict = Utility.ReadFile(self, f"{self.iXAssets}/localize.json")
-        placeholders: List[str] = Utility.ReadFile(
+        placeholders: Optional[List[str]] = Utility.ReadFile(
             self, "ModernWarfare/placeholders.json"
         )
 
-        for key in localize:
-            value: Optional[str] = localize.get(key)
+        log.info(f"Rendering XAssets in {len(self.iLanguages):,} additional languages")
 
-            if value is None:
-                continue
-            elif value == "":
-                localize[key] = None
-                continue
+        return {
+            language: Localize(path, placeholders or [], name=language)
+            for language, path in self.iLanguages.items()
+        }
 
-            for placeholder in placeholders:
-                if value.lower().startswith(placeholder.lower()):
-                    localize[key] = None
-                elif value.lower().endswith(placeholder.lower()):
-                    localize[key] = None
+    def ClearDeltas(self: Any, nodes: List[Dict[str, Any]]) -> None:
+        """
+        Empty the deltas of the provided compilers, which were skipped as
+        their outputs have not changed since the previous run.
+        """
 
-            if (value := localize.get(key)) is not None:
-                localize[key] = Utility.StripColorCodes(self, value)
+        for node in nodes:
+            for path in node.get("outputs"):
+                delta: str = f"{path.rsplit('.', 1)[0]}.delta.json"
+
+                if path.endswith(".json") is False:
+                    continue
+                elif Utility.FileExists(self, delta) is True:
+                    Utility.WriteJSON(
+                        self,
+                        {"added": [], "removed": [], "changed": []},
+                        pretty=delta,
+                        render=False,
+                        delta=False,
+                    )
+
+    def SaveLocalize(self: Any) -> None:
+        """
+        Cache the localized string entries which were used by this compile,
+        if any were requested that were not already cached.
+        """
 
-        return localize
+        if self.config.get("cache", {}).get("enabled") is not True:
+            return
+
+        used: Dict[str, Optional[str]] = self.localize.Used()
+
+        log.info(f"Used {len(used):,} localized strings")
+
+        if len(used) == self.localize.cached:
+            return
+
+        sources: List[str] = [
+            f"{self.iXAssets}/localize.json",
+            "ModernWarfare/placeholders.json",
+        ]
+        fingerprint: Tuple[Optional[str], ...] = tuple(
+            Manifest.Hash(self, path) for path in sources
+        )
+
+        if None not in fingerprint:
+            Utility.WriteCache(self, f"{sources[0]}:LoadLocalize", fingerprint, used)
 
     def GetLootRarity(self: Any, value: int) -> Optional[str]:
         """Get the loot rarity for the provided value."""
 
         return self.localize.get(f"LOOT_MP/QUALITY_{value}")
 
+    def GetLootRarities(self: Any, values: List[Optional[int]]) -> List[Optional[str]]:
+        """Get the loot rarities for the provided list of values."""
+
+        rarities: Dict[Optional[int], Optional[str]] = {}
+
+        for value in values:
+            if value not in rarities:
+                rarities[value] = ModernWarfare.GetLootRarity(self, value)
+
+        return [rarities[value] for value in values]
+
+    def IndexLootTypes(self: Any) -> Tuple[List[int], List[Optional[str]]]:
+        """
+        Compile the loot/loot_master.csv ranges into sorted, non-overlapping
+        segments. Return the start of each segment alongside the localize key
+        of the first range which contains it, or None for gaps.
+        """
+
+        ranges: List[Tuple[int, int, str]] = [
+            (loot.get("rangeStart"), loot.get("rangeEnd"), loot.get("typeNameLoc"))
+            for loot in self.lootTypes
+            if (loot.get("rangeStart") is not None)
+            and (loot.get("rangeEnd") is not None)
+        ]
+        bounds: List[int] = sorted(
+            {s for s, _, _ in ranges} | {e + 1 for _, e, _ in ranges}
+        )
+        starts: List[int] = []
+        keys: List[Optional[str]] = []
+
+        for bound in bounds:
+            key: Optional[str] = None
+
+            # Coverage only changes at a boundary, so the first range which
+            # contains the start of a segment contains all of it.
+            for start, end, loc in ranges:
+                if start <= bound <= end:
+                    key = loc
+
+                    break
+
+            if (len(starts) > 0) and (keys[-1] == key):
+                continue
+
+            starts.append(bound)
+            keys.append(key)
+
+        return (starts, keys)
+
     def GetLootType(self: Any, id: int) -> Optional[str]:
         """Get the loot type for the provided id."""
 
         if id is None:
             return
 
-        for loot in self.lootTypes:
-            start: int = loot.get("rangeStart")
-            end: int = loot.get("rangeEnd")
+        starts, keys = self.lootIndex
+
+        if (i := bisect_right(starts, id) - 1) < 0:
+            return
+
+        if (key := keys[i]) is None:
+            return
 
-            if (id >= start) and (id <= end):
-                return self.localize.get(loot.get("typeNameLoc"))
+        return self.localize.get(key)
+
+    def GetLootTypes(self: Any, ids: List[Optional[int]]) -> List[Optional[str]]:
+        """
+        Get the loot types for the provided list of ids. When NumPy is
+        available, every id is located in the loot type segments at once.
+        """
+
+        starts, keys = self.lootIndex
+
+        if (numpy is None) or (len(starts) == 0):
+            positions: List[int] = [
+                -1 if id is None else bisect_right(starts, id) - 1 for id in ids
+            ]
+        else:
+            values: Any = numpy.array([0 if id is None else id for id in ids])
+            segments: Any = numpy.searchsorted(starts, values, side="right") - 1
+
+            segments[numpy.array([id is None for id in ids], dtype=bool)] = -1
+            positions: List[int] = segments.tolist()
+
+        types: Dict[int, Optional[str]] = {-1: None}
+
+        for position in positions:
+            if position not in types:
+                key: Optional[str] = keys[position]
+                types[position] = None if key is None else self.localize.get(key)
+
+        return [types[position] for position in positions]
 
     def GetLootSeason(self: Any, license: int) -> Optional[str]:
         """Get the loot season for the provided value."""
@@ -272,6 +678,63 @@ class ModernWarfare:
 
         return self.localize.get(f"SEASONS/SEASON_{round(license / 1000)}")
 
+    def GetLootSeasons(self: Any, licenses: List[Optional[int]]) -> List[Optional[str]]:
+        """
+        Get the loot seasons for the provided list of license values. When
+        NumPy is available, the seasons are calculated for every value at
+        once using the same rules as GetLootSeason.
+        """
+
+        if numpy is None:
+            seasons: Dict[Optional[int], Optional[str]] = {None: None}
+
+            for license in licenses:
+                if license not in seasons:
+                    seasons[license] = ModernWarfare.GetLootSeason(self, license)
+
+            return [seasons[license] for license in licenses]
+
+        values: Any = numpy.array([0 if value is None else value for value in licenses])
+        reloaded: Any = (values - 1) % 1000 == 0
+        valid: List[bool] = ((values != 0) & (reloaded | (values % 1000 == 0))).tolist()
+        numbers: List[int] = (
+            numpy.where(reloaded, values - 1, values) // 1000
+        ).tolist()
+        names: Dict[int, Optional[str]] = {}
+
+        for number, seasonal in zip(numbers, valid):
+            if (seasonal is True) and (number not in names):
+                names[number] = self.localize.get(f"SEASONS/SEASON_{number}")
+
+        return [names.get(n) if v else None for n, v in zip(numbers, valid)]
+
+    def IndexReference(
+        self: Any, table: str, rows: Optional[List[Dict[str, Any]]], key: str
+    ) -> None:
+        """
+        Index the rows of the specified reference table by the provided key.
+        The first row wins if a key is not unique.
+        """
+
+        index: Dict[Any, Dict[str, Any]] = {}
+
+        for row in rows or []:
+            index.setdefault(row.get(key), row)
+
+        self.references.setdefault(table, {})[key] = index
+
+    def GetReference(
+        self: Any, table: str, key: str, value: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Get the row of the specified reference table which matches value."""
+
+        row: Optional[Dict[str, Any]] = self.references[table][key].get(value)
+
+        with Utility.lock:
+            self.lookups[(table, "misses" if row is None else "hits")] += 1
+
+        return row
+
     def GetOperatorID(self: Any, reference: str) -> Optional[int]:
         """Get the ID for the specified Operator."""
 
@@ -284,30 +747,42 @@ class ModernWarfare:
             # for use with Operators where isLaunchOperator is True.
             return 29998
 
-        for operator in self.operatorIds:
-            if reference == operator.get("ref"):
-                return operator.get("id")
+        operator: Optional[Dict[str, Any]] = ModernWarfare.GetReference(
+            self, "operatorIds", "ref", reference
+        )
+
+        if operator is not None:
+            return operator.get("id")
 
     def GetWeaponClass(self: Any, reference: str) -> Optional[str]:
         """Get the name of the specified Weapon Class."""
 
-        for weaponClass in self.weaponClasses:
-            if reference == weaponClass.get("ref"):
-                return self.localize.get(weaponClass.get("name"))
+        weaponClass: Optional[Dict[str, Any]] = ModernWarfare.GetReference(
+            self, "weaponClasses", "ref", reference
+        )
+
+        if weaponClass is not None:
+            return self.localize.get(weaponClass.get("name"))
 
     def GetAttachmentCategory(self: Any, reference: str) -> Optional[str]:
         """Get the name of the specified attachment category."""
 
-        for category in self.attachCategories:
-            if category.get("ref") == reference:
-                return self.localize.get(category.get("name"))
+        category: Optional[Dict[str, Any]] = ModernWarfare.GetReference(
+            self, "attachCategories", "ref", reference
+        )
+
+        if category is not None:
+            return self.localize.get(category.get("name"))
 
     def GetCamoCategory(self: Any, reference: str) -> Optional[str]:
         """Get the name of the specified camo category."""
 
-        for category in self.camoCategories:
-            if category.get("ref") == reference:
-                return self.localize.get(category.get("name"))
+        category: Optional[Dict[str, Any]] = ModernWarfare.GetReference(
+            self, "camoCategories", "ref", reference
+        )
+
+        if category is not None:
+            return self.localize.get(category.get("name"))
 
     def GetAttribute(self: Any, reference: str) -> Optional[str]:
         """
@@ -0,0 +1,116 @@
+import sys
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, TypedDict
+
+
+class Table:
+    """
+    Column-oriented representation of a comma separated values (csv) file.
+    Integer and float columns are stored in typed arrays and strings are
+    interned, which requires a fraction of the memory of a list of dicts.
+    Rows are looked up by the value of a column using a lazily built index.
+    """
+
+    def __init__(
+        self: Any, types: TypedDict, rows: Iterable[Dict[str, Any]] = ()
+    ) -> None:
+        self.types: TypedDict = types
+        self.fields: Dict[str, Any] = types.__annotations__
+        self.columns: Dict[str, Any] = {}
+        self.nulls: Dict[str, bytearray] = {}
+        self.indexes: Dict[str, Dict[Any, List[int]]] = {}
+        self.length: int = 0
+
+        for key, fieldType in self.fields.items():
+            if fieldType is int:
+                self.columns[key] = array("q")
+            elif fieldType is float:
+                self.columns[key] = array("d")
+            else:
+                self.columns[key] = []
+
+            self.nulls[key] = bytearray()
+
+        for row in rows:
+            Table.Append(self, row)
+
+    def __getstate__(self: Any) -> Dict[str, Any]:
+        return {k: v for k, v in self.__dict__.items() if k != "indexes"}
+
+    def __setstate__(self: Any, state: Dict[str, Any]) -> None:
+        # Indexes are rebuilt when requested, so they are not cached.
+        self.__dict__.update(state)
+        self.indexes = {}
+
+    def __len__(self: Any) -> int:
+        return self.length
+
+    def __iter__(self: Any) -> Iterator[Dict[str, Any]]:
+        for i in range(self.length):
+            yield Table.Row(self, i)
+
+    def Append(self: Any, row: Dict[str, Any]) -> None:
+        """Append the provided row to the end of the table."""
+
+        for key, column in self.columns.items():
+            value: Any = row.get(key)
+
+            if isinstance(column, list):
+                column.append(sys.intern(value) if isinstance(value, str) else value)
+                self.nulls[key].append(value is None)
+
+                continue
+
+            try:
+                column.append(0 if value is None else value)
+            except (OverflowError, TypeError):
+                # Values which do not fit the typed array demote the column
+                # to a plain list rather than losing data.
+                column = self.columns[key] = list(column)
+                column.append(0 if value is None else value)
+
+            self.nulls[key].append(value is None)
+
+        self.indexes.clear()
+        self.length += 1
+
+    def Get(self: Any, i: int, key: str) -> Any:
+        """Get the value of the specified column for the row at index i."""
+
+        if self.nulls[key][i] == 1:
+            return
+
+        return self.columns[key][i]
+
+    def Row(self: Any, i: int) -> Dict[str, Any]:
+        """Get the row at index i as a dictionary."""
+
+        return {key: Table.Get(self, i, key) for key in self.columns}
+
+    def Column(self: Any, key: str) -> List[Any]:
+        """Get the values of the specified column, including null values."""
+
+        return [Table.Get(self, i, key) for i in range(self.length)]
+
+    def Index(self: Any, key: str) -> Dict[Any, List[int]]:
+        """Get the row indexes of the table, grouped by the specified column."""
+
+        if (index := self.indexes.get(key)) is not None:
+            return index
+
+        index = self.indexes[key] = {}
+
+        for i, value in enumerate(Table.Column(self, key)):
+            index.setdefault(value, []).append(i)
+
+        return index
+
+    def FindAll(self: Any, key: str, value: Any) -> List[Dict[str, Any]]:
+        """Get every row where the specified column equals value, in order."""
+
+        return [Table.Row(self, i) for i in Table.Index(self, key).get(value, [])]
+
+    def Filter(self: Any, predicate: Callable[[Dict[str, Any]], bool]) -> Any:
+        """Return a new table of the rows which satisfy the predicate."""
+
+        return Table(self.types, (row for row in self if predicate(row)))
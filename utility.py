@@ -1,23 +1,48 @@
 import csv
+import hashlib
 import json
 import logging
+import os
+import pickle
 import re
 import shutil
 import subprocess
+import threading
+from collections import Counter
+from contextlib import ExitStack
 from datetime import datetime
 from glob import glob
 from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from PIL import Image
 
+from table import Table
+
 log: logging.Logger = logging.getLogger(__name__)
 
 
 class Utility:
     """Utilitarian functions intended to reduce duplicate code."""
 
+    # Row decoders built by GetDecoder, keyed by TypedDict schema.
+    decoders: Dict[Any, Callable[[List[str]], Dict[str, Any]]] = {}
+
+    # Guards the written file and reference lookup counters, which may be
+    # updated by several threads.
+    lock: threading.Lock = threading.Lock()
+
     def ReadFile(
         self: Any, path: str
     ) -> Optional[Union[Dict[str, Any], List[Any], str]]:
@@ -41,47 +66,461 @@ class Utility:
         """
 
         entries: List[Dict[str, Any]] = []
-        fields: Dict[str, Any] = types.__annotations__
+
+        if (fingerprint := Utility.FingerprintCSV(self, path, types, skip)) is None:
+            return entries
+
+        identity: str = f"{path}:{types.__module__}.{types.__qualname__}:{skip}"
+
+        if (cached := Utility.ReadCache(self, identity, fingerprint)) is not None:
+            return cached
+
+        decoder: Callable[[List[str]], Dict[str, Any]] = Utility.GetDecoder(self, types)
 
         try:
             with open(path, "r", encoding="utf-8") as file:
-                if skip > 0:
-                    file: List[str] = file.readlines()[skip:]
-
-                for row in csv.DictReader(file, fieldnames=list(fields)):
-                    entries.append(
-                        {
-                            key: None
-                            if ((v := value) == "") or (v is None)
-                            else fields[key](value)
-                            for key, value in islice(row.items(), 0, len(list(fields)))
-                        }
-                    )
+                for row in csv.reader(islice(file, skip, None)):
+                    if len(row) == 0:
+                        continue
+
+                    entries.append(decoder(row))
         except Exception as e:
             log.error(f"Failed to read file {path}, {e}")
 
+            return entries
+
+        Utility.WriteCache(self, identity, fingerprint, entries)
+
         return entries
 
+    def StreamCSV(
+        self: Any, path: str, types: TypedDict, skip: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily read and transform a comma separated values (csv) file,
+        yielding a dictionary with the desired value types for each row.
+        """
+
+        decoder: Callable[[List[str]], Dict[str, Any]] = Utility.GetDecoder(self, types)
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                for row in csv.reader(islice(file, skip, None)):
+                    if len(row) == 0:
+                        continue
+
+                    yield decoder(row)
+        except Exception as e:
+            log.error(f"Failed to read file {path}, {e}")
+
+    def ReadTable(self: Any, path: str, types: TypedDict, skip: int = 0) -> Table:
+        """
+        Read and transform a comma separated values (csv) file to a
+        column-oriented table with the desired value types.
+        """
+
+        if (fingerprint := Utility.FingerprintCSV(self, path, types, skip)) is None:
+            return Table(types)
+
+        identity: str = f"{path}:{types.__module__}.{types.__qualname__}:{skip}:Table"
+
+        if (cached := Utility.ReadCache(self, identity, fingerprint)) is not None:
+            return cached
+
+        table: Table = Table(types)
+        decoder: Callable[[List[str]], Dict[str, Any]] = Utility.GetDecoder(self, types)
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                for row in csv.reader(islice(file, skip, None)):
+                    if len(row) == 0:
+                        continue
+
+                    Table.Append(table, decoder(row))
+        except Exception as e:
+            log.error(f"Failed to read file {path}, {e}")
+
+            return table
+
+        Utility.WriteCache(self, identity, fingerprint, table)
+
+        return table
+
+    def FingerprintCSV(
+        self: Any, path: str, types: TypedDict, skip: int = 0
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Return the fingerprint which cached contents of a comma separated
+        values (csv) file are stored with. They are only valid for the same
+        file contents, schema and number of skipped lines.
+        """
+
+        try:
+            stat: os.stat_result = os.stat(path)
+        except Exception as e:
+            log.error(f"Failed to read file {path}, {e}")
+
+            return
+
+        return (
+            stat.st_size,
+            stat.st_mtime_ns,
+            skip,
+            tuple(
+                (k, getattr(v, "__name__", repr(v)))
+                for k, v in types.__annotations__.items()
+            ),
+        )
+
+    def GetDecoder(
+        self: Any, types: TypedDict
+    ) -> Callable[[List[str]], Dict[str, Any]]:
+        """
+        Return a function which transforms a comma separated values (csv)
+        row to a dictionary with the value types of the provided schema.
+        Missing values and empty strings become None, extra values are
+        discarded.
+        """
+
+        if (cached := Utility.decoders.get(types)) is not None:
+            return cached
+
+        # String columns need no conversion, which spares a call per value.
+        columns: Tuple[Tuple[str, Optional[Callable[[str], Any]]], ...] = tuple(
+            (key, None if convert is str else convert)
+            for key, convert in types.__annotations__.items()
+        )
+        count: int = len(columns)
+
+        def decoder(row: List[str]) -> Dict[str, Any]:
+            if len(row) < count:
+                row = row + [""] * (count - len(row))
+
+            return {
+                key: (
+                    (value or None)
+                    if convert is None
+                    else (convert(value) if value else None)
+                )
+                for (key, convert), value in zip(columns, row)
+            }
+
+        Utility.decoders[types] = decoder
+
+        return decoder
+
+    def ReadCache(self: Any, key: str, fingerprint: Tuple[Any, ...]) -> Optional[Any]:
+        """
+        Return the cached contents for the specified key if caching is enabled
+        and the fingerprint they were stored with matches.
+        """
+
+        if (cache := self.config.get("cache", {})).get("enabled") is not True:
+            return
+
+        path: str = f"{cache['path']}/{hashlib.sha1(key.encode()).hexdigest()}.pickle"
+
+        try:
+            with open(path, "rb") as file:
+                cached: Dict[str, Any] = pickle.load(file)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            log.warning(f"Failed to read cache file {path}, {e}")
+
+            return
+
+        if (cached.get("key") != key) or (cached.get("fingerprint") != fingerprint):
+            return
+
+        return cached.get("contents")
+
+    def WriteCache(
+        self: Any, key: str, fingerprint: Tuple[Any, ...], contents: Any
+    ) -> None:
+        """Store the provided contents for the specified key if caching is enabled."""
+
+        if (cache := self.config.get("cache", {})).get("enabled") is not True:
+            return
+
+        path: str = f"{cache['path']}/{hashlib.sha1(key.encode()).hexdigest()}.pickle"
+        temp: str = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            Path(cache["path"]).mkdir(parents=True, exist_ok=True)
+
+            with open(temp, "wb") as file:
+                pickle.dump(
+                    {"key": key, "fingerprint": fingerprint, "contents": contents},
+                    file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+            # Replace the previous entry atomically as parallel workers may
+            # read the same file.
+            os.replace(temp, path)
+        except Exception as e:
+            log.warning(f"Failed to write cache file {path}, {e}")
+
     def WriteFile(
         self: Any, path: str, contents: Union[str, dict, list], **kwargs
     ) -> None:
         """Write the contents of the specified file."""
 
+        if path.rsplit(".")[1] == "json":
+            render: bool = kwargs.get("render", True)
+
+            if kwargs.get("compress") is True:
+                Utility.WriteJSON(self, contents, compressed=path, render=render)
+            else:
+                Utility.WriteJSON(self, contents, pretty=path, render=render)
+
+            return
+
         if Path(dirPath := (path.rsplit("/", 1)[0])).exists() is False:
             Path(dirPath).mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(path, "w+", encoding="utf-8") as file:
-                if path.rsplit(".")[1] == "json":
-                    if kwargs.get("compress") is True:
-                        file.write(json.dumps(contents, ensure_ascii=False))
-                    else:
-                        file.write(json.dumps(contents, indent=4, ensure_ascii=False))
-                else:
-                    file.write(contents)
+            with open(Utility.TempPath(self, path), "w+", encoding="utf-8") as file:
+                file.write(contents)
+
+            Utility.CommitFile(self, path)
         except Exception as e:
             log.error(f"Failed to write file {path}, {e}")
 
+            Utility.DiscardFile(self, path)
+
+    def WriteJSON(
+        self: Any,
+        contents: Union[dict, list],
+        compressed: Optional[str] = None,
+        pretty: Optional[str] = None,
+        render: bool = True,
+        delta: bool = True,
+    ) -> None:
+        """
+        Write the provided contents as compressed and/or pretty-printed JSON.
+        Lists are encoded and written one element at a time, in a single
+        traversal for both variants, rather than as one string. Unless render
+        is False, the contents are also rendered and written to a
+        subdirectory for each of the additional languages, if any. Unless
+        delta is False, the changes since the previous run are also written
+        if deltas are enabled.
+        """
+
+        targets: Dict[str, bool] = {
+            path: compress
+            for path, compress in [(compressed, True), (pretty, False)]
+            if path is not None
+        }
+
+        if render is True:
+            for name, localize in getattr(self, "languages", {}).items():
+                Utility.WriteJSON(
+                    self,
+                    localize.Render(contents),
+                    *[
+                        None if p is None else f"/{name}/".join(p.rsplit("/", 1))
+                        for p in [compressed, pretty]
+                    ],
+                    render=False,
+                    delta=False,
+                )
+
+        for path in targets:
+            if Path(dirPath := (path.rsplit("/", 1)[0])).exists() is False:
+                Path(dirPath).mkdir(parents=True, exist_ok=True)
+
+        try:
+            with ExitStack() as stack:
+                files: List[Tuple[Any, bool]] = [
+                    (
+                        stack.enter_context(
+                            open(Utility.TempPath(self, path), "w+", encoding="utf-8")
+                        ),
+                        compress,
+                    )
+                    for path, compress in targets.items()
+                ]
+
+                if (isinstance(contents, list) is False) or (len(contents) == 0):
+                    for file, compress in files:
+                        file.write(
+                            json.dumps(
+                                contents,
+                                indent=None if compress else 4,
+                                ensure_ascii=False,
+                            )
+                        )
+                else:
+                    for i, element in enumerate(contents):
+                        for file, compress in files:
+                            if compress is True:
+                                file.write("[" if i == 0 else ", ")
+                                file.write(json.dumps(element, ensure_ascii=False))
+                            else:
+                                # Encoded strings never contain a line break, so
+                                # every line of the element is nested one level.
+                                file.write("[\n    " if i == 0 else ",\n    ")
+                                file.write(
+                                    json.dumps(
+                                        element, indent=4, ensure_ascii=False
+                                    ).replace("\n", "\n    ")
+                                )
+
+                    for file, compress in files:
+                        file.write("]" if compress is True else "\n]")
+
+            # The delta is written before the previous output is replaced.
+            if (delta is True) and (
+                self.config.get("delta", {}).get("enabled") is True
+            ):
+                Utility.WriteDelta(self, next(iter(targets)), contents)
+
+            for path in targets:
+                Utility.CommitFile(self, path)
+        except Exception as e:
+            log.error(f"Failed to write file {', '.join(targets)}, {e}")
+
+            for path in targets:
+                Utility.DiscardFile(self, path)
+
+    def WriteDelta(self: Any, path: str, contents: Union[dict, list]) -> None:
+        """
+        Write the items which were added, removed, or changed between the
+        existing file and the provided list of items to a sibling delta
+        file, with the fields of each changed item. Items are matched by
+        their identity and compared by hash, so that only changed items are
+        compared field by field.
+        """
+
+        if (isinstance(contents, list) is False) or (
+            all(isinstance(item, dict) for item in contents) is False
+        ):
+            return
+
+        previous: Any = []
+
+        if Path(path).is_file() is True:
+            previous = Utility.ReadFile(self, path)
+
+        if isinstance(previous, list) is False:
+            return
+
+        old: Dict[Any, Tuple[str, Any]] = Utility.HashItems(self, previous)
+        new: Dict[Any, Tuple[str, Any]] = Utility.HashItems(self, contents)
+        changes: Dict[str, List[Any]] = {"added": [], "removed": [], "changed": []}
+
+        for key, (digest, item) in new.items():
+            if key not in old:
+                changes["added"].append(item)
+            elif digest != old[key][0]:
+                before: Any = old[key][1]
+                fields: Dict[str, Dict[str, Any]] = {}
+
+                for field in dict.fromkeys([*before, *item]):
+                    if (field in before) and (field in item):
+                        if before[field] == item[field]:
+                            continue
+
+                    fields[field] = {"old": before.get(field), "new": item.get(field)}
+
+                changes["changed"].append(
+                    {**Utility.DeltaKey(self, key), "fields": fields}
+                )
+
+        for key in old:
+            if key not in new:
+                changes["removed"].append(Utility.DeltaKey(self, key))
+
+        Utility.WriteJSON(
+            self,
+            changes,
+            pretty=f"{path.rsplit('.', 1)[0]}.delta.json",
+            render=False,
+            delta=False,
+        )
+
+    def HashItems(self: Any, items: List[Any]) -> Dict[Any, Tuple[str, Any]]:
+        """
+        Return the hash of each of the provided items, keyed by its identity
+        and the number of preceding items with the same identity. The
+        identity is the first of its id, altId, or name which is not null,
+        otherwise the hash itself.
+        """
+
+        hashes: Dict[Any, Tuple[str, Any]] = {}
+        occurrences: Counter = Counter()
+
+        for item in items:
+            digest: str = hashlib.sha1(
+                json.dumps(item, sort_keys=True, ensure_ascii=False).encode("utf-8")
+            ).hexdigest()
+            identity: Any = next(
+                (v for k in ["id", "altId", "name"] if (v := item.get(k)) is not None),
+                digest,
+            )
+
+            hashes[(identity, occurrences[identity])] = (digest, item)
+            occurrences[identity] += 1
+
+        return hashes
+
+    def DeltaKey(self: Any, key: Tuple[Any, int]) -> Dict[str, Any]:
+        """Return the provided item identity as it is written to a delta."""
+
+        if key[1] == 0:
+            return {"key": key[0]}
+
+        return {"key": key[0], "occurrence": key[1]}
+
+    def TempPath(self: Any, path: str) -> str:
+        """Return the path of the temporary file used to write the specified file."""
+
+        return f"{path}.{os.getpid()}.tmp"
+
+    def CommitFile(self: Any, path: str) -> bool:
+        """
+        Atomically replace the specified file with its temporary file if
+        their contents differ, otherwise discard the temporary file, so that
+        unchanged files keep their modification time. Return a boolean value
+        indicating whether or not the file changed.
+        """
+
+        temp: str = Utility.TempPath(self, path)
+        changed: bool = True
+
+        if Path(path).is_file() and (os.stat(path).st_size == os.stat(temp).st_size):
+            with open(temp, "rb") as new, open(path, "rb") as old:
+                changed = any(
+                    a != b
+                    for a, b in zip(
+                        iter(lambda: new.read(1048576), b""),
+                        iter(lambda: old.read(1048576), b""),
+                    )
+                )
+
+        if changed is True:
+            os.replace(temp, path)
+        else:
+            os.remove(temp)
+
+        if (writes := getattr(self, "writes", None)) is not None:
+            with Utility.lock:
+                writes["changed" if changed is True else "unchanged"] += 1
+
+        return changed
+
+    def DiscardFile(self: Any, path: str) -> None:
+        """Remove the temporary file of the specified file, if it exists."""
+
+        try:
+            os.remove(Utility.TempPath(self, path))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning(f"Failed to remove file {Utility.TempPath(self, path)}, {e}")
+
     def FileExists(self: Any, path: str) -> bool:
         """
         Return a boolean value indicating whether or not the specified
@@ -154,6 +593,44 @@ class Utility:
         elif value == "N":
             return False
 
+    def Join(
+        self: Any,
+        left: List[Dict[str, Any]],
+        right: List[Dict[str, Any]],
+        leftKey: Union[str, Callable[[Dict[str, Any]], Any]],
+        rightKey: Union[str, Callable[[Dict[str, Any]], Any]],
+        how: str = "inner",
+    ) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Join the provided lists of dicts on the specified keys, which are
+        either a key name or a function of the row. Yield each left row
+        with every matching right row in order. A left join also yields
+        unmatched left rows, paired with None.
+        """
+
+        if how not in ("inner", "left"):
+            raise ValueError(f"Unsupported join type {how}")
+
+        if isinstance(leftKey, str):
+            leftKey = lambda row, key=leftKey: row.get(key)
+
+        if isinstance(rightKey, str):
+            rightKey = lambda row, key=rightKey: row.get(key)
+
+        index: Dict[Any, List[Dict[str, Any]]] = {}
+
+        for row in right:
+            index.setdefault(rightKey(row), []).append(row)
+
+        for row in left:
+            matches: List[Dict[str, Any]] = index.get(leftKey(row), [])
+
+            for match in matches:
+                yield (row, match)
+
+            if (how == "left") and (len(matches) == 0):
+                yield (row, None)
+
     def SortList(
         self: Any, array: List[Dict[str, Any]], key: str, **kwargs
     ) -> List[Dict[str, Any]]:
@@ -202,6 +679,9 @@ class Utility:
         ]
         output: str = input
 
+        if "^" not in output:
+            return output
+
         for i in colors:
             output: str = output.replace(f"^{i}", "")
 